@@ -90,6 +90,16 @@ class Direction(IntFlag):
     TRAVEL = 15360
 
 
+class PuzzleFlag(IntFlag):
+    """Packed puzzle state flags gating conditional exits."""
+
+    NONE = 0
+    RUG_MOVED = 1  # Rug moved revealing trap door
+    ROPE_TIED = 2  # Rope tied to railing in dome
+    GRATE_OPEN = 4  # Grating unlocked/opened
+    GATES_OPEN = 8  # Gates of Hades opened
+
+
 class ExitType(IntFlag):
     """Exit types for room connections."""
 
@@ -126,6 +136,26 @@ class Room:
 
     # Runtime state (not persisted in world JSON)
     _action_handler: Callable | None = field(default=None, repr=False)
+    _exits_by_dir: dict[Direction, Exit] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _available_exits: list[Exit] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def index_exits(self) -> dict[Direction, Exit]:
+        """Rebuild the direction -> exit lookup from the exit list."""
+        # First exit listed for a direction wins, as with a linear scan
+        self._exits_by_dir = {e.direction: e for e in reversed(self.exits)}
+        self._available_exits = [
+            e for e in self.exits if e.exit_type != ExitType.NO_EXIT
+        ]
+        return self._exits_by_dir
+
+    def set_exits(self, exits: list[Exit]) -> None:
+        """Replace the room's exits and refresh the lookup."""
+        self.exits = exits
+        self.index_exits()
 
     def is_lit(self) -> bool:
         """Check if room is naturally lit."""
@@ -173,6 +203,8 @@ class Object:
 
     # Runtime handler (not persisted)
     _action_handler: Callable | None = field(default=None, repr=False)
+    # Lowercased name and synonyms for name matching, set by World.add_object
+    _search_tokens: tuple[str, ...] = field(default=(), repr=False, compare=False)
 
     def is_visible(self) -> bool:
         """Check if object is visible."""
@@ -10,6 +10,7 @@ from pymeshzork.engine.models import (
     Object,
     ObjectFlag1,
     ObjectFlag2,
+    PuzzleFlag,
     Room,
     RoomFlag,
 )
@@ -18,6 +19,18 @@ if TYPE_CHECKING:
     from pymeshzork.engine.world import World
 
 
+# Puzzle flag names used by conditional exits (and older save files)
+PUZZLE_FLAG_NAMES: dict[str, PuzzleFlag] = {
+    "rug_moved": PuzzleFlag.RUG_MOVED,
+    "rope_tied": PuzzleFlag.ROPE_TIED,
+    "grate_open": PuzzleFlag.GRATE_OPEN,
+    "gates_open": PuzzleFlag.GATES_OPEN,
+}
+
+# ObjectState fields that place an object in the world
+_LOCATION_FIELDS = frozenset({"room_id", "actor_id", "container_id"})
+
+
 @dataclass
 class RoomState:
     """Runtime state for a room."""
@@ -46,6 +59,22 @@ class ObjectState:
     flags2: ObjectFlag2 = ObjectFlag2.NONE
     properties: dict = field(default_factory=dict)  # Dynamic properties
 
+    # Owning GameState, whose location/light indexes track this object
+    _owner: "GameState | None" = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in _LOCATION_FIELDS and self._owner is not None:
+            old = getattr(self, name)
+            object.__setattr__(self, name, value)
+            if old != value:
+                self._owner._reindex(self, name, old, value)
+        else:
+            object.__setattr__(self, name, value)
+            if name == "flags1" and self._owner is not None:
+                self._owner._light_changed(self)
+            elif name == "_owner" and value is not None:
+                value._index_object(self)
+
     def is_in_room(self, room_id: str) -> bool:
         """Check if object is in a specific room."""
         return self.room_id == room_id and self.actor_id is None and self.container_id is None
@@ -122,12 +151,6 @@ class GameFlags:
     thfenf: bool = False  # Thief engaged
     singsf: bool = False  # Singing
     mrpshf: bool = False  # Mirror pushed
-
-    # Puzzle state flags for conditional exits
-    rug_moved: bool = False  # Rug moved revealing trap door
-    grate_open: bool = False  # Grating unlocked/opened
-    rope_tied: bool = False  # Rope tied to railing in dome
-    gates_open: bool = False  # Gates of Hades opened
     mropnf: bool = False  # Mirror open
     wdopnf: bool = False  # Wooden door open
     mr1f: bool = False  # Mirror room 1
@@ -230,6 +253,9 @@ class GameState:
     # Game flags
     flags: GameFlags = field(default_factory=GameFlags)
 
+    # Puzzle state flags for conditional exits (packed bitmask)
+    puzzle_flags: PuzzleFlag = PuzzleFlag.NONE
+
     # Combat state
     villain_state: VillainState = field(default_factory=VillainState)
 
@@ -256,6 +282,60 @@ class GameState:
     player_wounds: int = 0  # Accumulated damage (death at 10)
     player_health: int = 10  # Maximum health
 
+    # Reverse location indexes: location id -> object ids (dicts as ordered sets)
+    _by_room: dict[str, dict[str, None]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _by_holder: dict[str, dict[str, None]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _by_container: dict[str, dict[str, None]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # Objects whose ONBT (light on) flag is set
+    _lit_objects: dict[str, None] = field(default_factory=dict, repr=False, compare=False)
+
+    def _location_index(self, field_name: str) -> dict[str, dict[str, None]]:
+        """Get the reverse index for an ObjectState location field."""
+        if field_name == "room_id":
+            return self._by_room
+        if field_name == "actor_id":
+            return self._by_holder
+        return self._by_container
+
+    def _index_object(self, obj_state: ObjectState) -> None:
+        """Add an object's current location to the reverse indexes."""
+        for name in _LOCATION_FIELDS:
+            location = getattr(obj_state, name)
+            if location is not None:
+                self._location_index(name).setdefault(location, {})[obj_state.object_id] = None
+        self._light_changed(obj_state)
+
+    def _light_changed(self, obj_state: ObjectState) -> None:
+        """Track whether an object's light is on after its flags change."""
+        if obj_state.flags1 & ObjectFlag1.ONBT:
+            self._lit_objects[obj_state.object_id] = None
+        else:
+            self._lit_objects.pop(obj_state.object_id, None)
+
+    def lit_objects(self) -> list[str]:
+        """Get all objects whose light is currently on."""
+        return list(self._lit_objects)
+
+    def _reindex(
+        self, obj_state: ObjectState, field_name: str, old: str | None, new: str | None
+    ) -> None:
+        """Move an object between reverse index buckets after a location change."""
+        index = self._location_index(field_name)
+        if old is not None:
+            bucket = index.get(old)
+            if bucket is not None:
+                bucket.pop(obj_state.object_id, None)
+                if not bucket:
+                    del index[old]
+        if new is not None:
+            index.setdefault(new, {})[obj_state.object_id] = None
+
     def get_room_state(self, room_id: str) -> RoomState:
         """Get or create state for a room."""
         if room_id not in self.room_states:
@@ -265,7 +345,7 @@ class GameState:
     def get_object_state(self, object_id: str) -> ObjectState:
         """Get or create state for an object."""
         if object_id not in self.object_states:
-            self.object_states[object_id] = ObjectState(object_id=object_id)
+            self.object_states[object_id] = ObjectState(object_id=object_id, _owner=self)
         return self.object_states[object_id]
 
     def get_actor_state(self, actor_id: str) -> ActorState:
@@ -305,24 +385,19 @@ class GameState:
 
     def objects_in_room(self, room_id: str) -> list[str]:
         """Get all objects visible in a room."""
+        object_states = self.object_states
         return [
-            obj_id for obj_id, state in self.object_states.items()
-            if state.is_in_room(room_id)
+            obj_id for obj_id in self._by_room.get(room_id, ())
+            if object_states[obj_id].is_in_room(room_id)
         ]
 
     def objects_held_by(self, actor_id: str) -> list[str]:
         """Get all objects held by an actor."""
-        return [
-            obj_id for obj_id, state in self.object_states.items()
-            if state.is_held_by(actor_id)
-        ]
+        return list(self._by_holder.get(actor_id, ()))
 
     def objects_in_container(self, container_id: str) -> list[str]:
         """Get all objects in a container."""
-        return [
-            obj_id for obj_id, state in self.object_states.items()
-            if state.is_in_container(container_id)
-        ]
+        return list(self._by_container.get(container_id, ()))
 
     def move_object_to_room(self, object_id: str, room_id: str) -> None:
         """Move an object to a room."""
@@ -389,6 +464,7 @@ class GameState:
             "flags": {
                 k: v for k, v in self.flags.__dict__.items()
             },
+            "puzzle_flags": int(self.puzzle_flags),
             "last_it": self.last_it,
         }
 
@@ -422,6 +498,7 @@ class GameState:
                 flags1=ObjectFlag1(v.get("flags1", 0)),
                 flags2=ObjectFlag2(v.get("flags2", 0)),
                 properties=v.get("properties", {}),
+                _owner=state,
             )
 
         # Restore actor states
@@ -444,9 +521,13 @@ class GameState:
             )
 
         # Restore flags
+        state.puzzle_flags = PuzzleFlag(data.get("puzzle_flags", 0))
         if "flags" in data:
             for k, v in data["flags"].items():
                 if hasattr(state.flags, k):
                     setattr(state.flags, k, v)
+                elif k in PUZZLE_FLAG_NAMES and v:
+                    # Older saves stored puzzle flags as separate booleans
+                    state.puzzle_flags |= PUZZLE_FLAG_NAMES[k]
 
         return state
@@ -1,14 +1,32 @@
 """Verb handlers for PyMeshZork - command execution."""
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, ClassVar
 
-from pymeshzork.engine.models import Direction, ObjectFlag1, ObjectFlag2
+from pymeshzork.engine.models import Direction, ObjectFlag1, ObjectFlag2, PuzzleFlag
 from pymeshzork.engine.parser import ParsedCommand
 
 if TYPE_CHECKING:
     from pymeshzork.engine.game import Game
 
+# Object IDs that refer to the grating (special-cased by UNLOCK)
+_GRATE = frozenset({"grate", "grati", "grating"})
+
+# Object and room IDs special-cased by individual verbs
+_MACHINE = frozenset({"machi", "machine"})
+_CYCLOPS = frozenset({"cyclo", "cyclops"})
+_LAMP = frozenset({"lamp", "lante", "lantern"})
+_MATCHES = frozenset({"match", "matches"})
+_CANDLES = frozenset({"candl", "candle", "candles"})
+_RAILING = frozenset({"railing", "rail"})
+_INFLATABLE_BOAT = frozenset({"iboat", "boat"})
+_BOAT = frozenset({"iboat", "boat", "rboat"})
+_CANARY = frozenset({"canar", "canary"})
+_SCEPTRE = frozenset({"scept", "scepter", "sceptre"})
+_FIRE_SOURCES = frozenset({"match", "torch"})
+_TREE_ROOMS = frozenset({"fore3", "uptree"})
+_TEMPLE_ROOMS = frozenset({"temp1", "temp2"})
+
 
 @dataclass
 class VerbResult:
@@ -23,6 +41,15 @@ class VerbResult:
 class VerbHandler:
     """Handles verb execution for the game."""
 
+    # Magic words recognised by SAY, mapped to the handler method name
+    _MAGIC_WORDS: ClassVar[dict[str, str]] = {
+        "odysseus": "do_odysseus",
+        "ulysses": "do_odysseus",
+        "xyzzy": "_say_fool",
+        "plugh": "_say_fool",
+        "plover": "_say_fool",
+    }
+
     def __init__(self, game: "Game") -> None:
         """Initialize verb handler with game reference."""
         self.game = game
@@ -399,7 +426,7 @@ class VerbHandler:
             )
 
         # Special case: putting coal in machine
-        if cmd.direct_object == "coal" and cmd.indirect_object in ["machi", "machine"]:
+        if cmd.direct_object == "coal" and cmd.indirect_object in _MACHINE:
             room_result = self.game.room_actions.on_action(
                 self.game.state.current_room,
                 "put",
@@ -798,7 +825,7 @@ class VerbHandler:
                     self.game.state.flags.trollf = True
                 elif obj.id == "thief":
                     self.game.state.flags.thfenf = True
-                elif obj.id in ["cyclo", "cyclops"]:
+                elif obj.id in _CYCLOPS:
                     self.game.state.flags.cyclof = True
                 return VerbResult(
                     success=True,
@@ -934,7 +961,7 @@ class VerbHandler:
         obj_state.flags1 |= ObjectFlag1.ONBT
 
         # Start appropriate timer based on light source
-        if obj.id in ["lamp", "lante", "lantern"]:
+        if obj.id in _LAMP:
             # Lantern has battery life
             remaining = obj_state.properties.get("light_remaining", 350)
             if remaining > 0:
@@ -946,10 +973,10 @@ class VerbHandler:
                     message="The lamp's batteries are dead.",
                     end_turn=False,
                 )
-        elif obj.id in ["match", "matches"]:
+        elif obj.id in _MATCHES:
             # Match burns out quickly
             self.game.events.set_event(EventID.MATCH, 2)
-        elif obj.id in ["candl", "candle", "candles"]:
+        elif obj.id in _CANDLES:
             # Candles last longer
             self.game.events.set_event(EventID.CANDLE, 50)
 
@@ -995,11 +1022,11 @@ class VerbHandler:
         obj_state.flags1 &= ~ObjectFlag1.ONBT
 
         # Cancel timers when turning off
-        if obj.id in ["lamp", "lante", "lantern"]:
+        if obj.id in _LAMP:
             self.game.events.cancel_event(EventID.LANTERN)
-        elif obj.id in ["match", "matches"]:
+        elif obj.id in _MATCHES:
             self.game.events.cancel_event(EventID.MATCH)
-        elif obj.id in ["candl", "candle", "candles"]:
+        elif obj.id in _CANDLES:
             self.game.events.cancel_event(EventID.CANDLE)
 
         return VerbResult(
@@ -1141,7 +1168,7 @@ class VerbHandler:
                     )
                 obj_state.flags2 |= ObjectFlag2.TCHBT
                 # Set puzzle flag to enable trap door exit
-                self.game.state.flags.rug_moved = True
+                self.game.state.puzzle_flags |= PuzzleFlag.RUG_MOVED
                 return VerbResult(
                     success=True,
                     message="With great effort, the rug is moved to one side of the room, revealing the dusty cover of a closed trap door.",
@@ -1216,7 +1243,7 @@ class VerbHandler:
             )
 
         # Tie rope to railing
-        if cmd.indirect_object and cmd.indirect_object not in ["railing", "rail"]:
+        if cmd.indirect_object and cmd.indirect_object not in _RAILING:
             return VerbResult(
                 success=False,
                 message=f"You can't tie the rope to that.",
@@ -1228,7 +1255,7 @@ class VerbHandler:
         # Move rope to room
         self.game.state.move_object_to_room(obj.id, room.id)
         # Set puzzle flag to enable dome-torch room passage
-        self.game.state.flags.rope_tied = True
+        self.game.state.puzzle_flags |= PuzzleFlag.ROPE_TIED
 
         return VerbResult(
             success=True,
@@ -1265,7 +1292,7 @@ class VerbHandler:
         self.game.state.move_object_to_actor(obj.id, "player")
         # Clear puzzle flag - rope no longer tied
         if obj.id == "rope":
-            self.game.state.flags.rope_tied = False
+            self.game.state.puzzle_flags &= ~PuzzleFlag.ROPE_TIED
 
         return VerbResult(
             success=True,
@@ -1292,7 +1319,7 @@ class VerbHandler:
             )
 
         # Only the boat can be inflated
-        if obj.id not in ["iboat", "boat"]:
+        if obj.id not in _INFLATABLE_BOAT:
             return VerbResult(
                 success=False,
                 message=f"You can't inflate the {obj.name}.",
@@ -1343,7 +1370,7 @@ class VerbHandler:
                 end_turn=False,
             )
 
-        if obj.id not in ["iboat", "boat", "rboat"]:
+        if obj.id not in _BOAT:
             return VerbResult(
                 success=False,
                 message=f"You can't deflate the {obj.name}.",
@@ -1385,7 +1412,7 @@ class VerbHandler:
             )
 
         # Only the canary can be wound
-        if obj.id not in ["canar", "canary"]:
+        if obj.id not in _CANARY:
             return VerbResult(
                 success=False,
                 message=f"You can't wind the {obj.name}.",
@@ -1404,7 +1431,7 @@ class VerbHandler:
         room = self.game.world.get_room(self.game.state.current_room)
 
         # Special case: in the forest near the tree, the bird's song attracts the songbird
-        if room and room.id in ["fore3", "uptree"]:
+        if room and room.id in _TREE_ROOMS:
             return VerbResult(
                 success=True,
                 message="The canary begins to sing. From somewhere nearby, an answering song is heard. A songbird flies down and lands on the branch beside you!",
@@ -1463,7 +1490,7 @@ class VerbHandler:
             if candles_state and candles_state.is_held_by("player"):
                 if book_state and book_state.is_held_by("player"):
                     # Successful exorcism - open gates of Hades
-                    self.game.state.flags.gates_open = True
+                    self.game.state.puzzle_flags |= PuzzleFlag.GATES_OPEN
                     return VerbResult(
                         success=True,
                         message="The bell rings with a pure tone that echoes through the chamber. The spirits begin to stir...\n\nThe candles flicker with an eerie light. With a great creaking, the gates of Hades swing open!",
@@ -1509,7 +1536,7 @@ class VerbHandler:
         room = self.game.world.get_room(self.game.state.current_room)
 
         # Special case: waving scepter at rainbow
-        if obj.id in ["scept", "scepter", "sceptre"]:
+        if obj.id in _SCEPTRE:
             if room and room.id == "mrain":
                 return VerbResult(
                     success=True,
@@ -1612,7 +1639,8 @@ class VerbHandler:
                 end_turn=False,
             )
 
-        obj = self.game.world.get_object(cmd.direct_object)
+        world = self.game.world
+        obj = world.get_object(cmd.direct_object)
         if not obj:
             return VerbResult(
                 success=False,
@@ -1621,10 +1649,9 @@ class VerbHandler:
             )
 
         # Check for key in inventory
-        keys = self.game.world.get_object("keys")
-        keys_state = self.game.state.get_object_state("keys") if keys else None
-
-        if not keys_state or not keys_state.is_held_by("player"):
+        if "keys" not in world.objects or not (
+            self.game.state.get_object_state("keys").is_held_by("player")
+        ):
             return VerbResult(
                 success=False,
                 message="You don't have anything to unlock it with.",
@@ -1632,7 +1659,7 @@ class VerbHandler:
             )
 
         # Special case: grating
-        if obj.id in ["grate", "grati", "grating"]:
+        if obj.id in _GRATE:
             obj_state = self.game.state.get_object_state(obj.id)
             if obj_state.flags2 & ObjectFlag2.OPENBT:
                 return VerbResult(
@@ -1642,13 +1669,13 @@ class VerbHandler:
                 )
             obj_state.flags2 |= ObjectFlag2.OPENBT
             # Set puzzle flag to enable grating passage
-            self.game.state.flags.grate_open = True
+            self.game.state.puzzle_flags |= PuzzleFlag.GRATE_OPEN
             return VerbResult(
                 success=True,
                 message="The grating is now unlocked.",
             )
 
-        if not obj.is_door():
+        if obj.id not in world.door_ids:
             return VerbResult(
                 success=False,
                 message=f"You can't unlock the {obj.name}.",
@@ -1669,7 +1696,8 @@ class VerbHandler:
                 end_turn=False,
             )
 
-        obj = self.game.world.get_object(cmd.direct_object)
+        world = self.game.world
+        obj = world.get_object(cmd.direct_object)
         if not obj:
             return VerbResult(
                 success=False,
@@ -1677,7 +1705,7 @@ class VerbHandler:
                 end_turn=False,
             )
 
-        if not obj.is_door():
+        if obj.id not in world.door_ids:
             return VerbResult(
                 success=False,
                 message=f"You can't lock the {obj.name}.",
@@ -1712,7 +1740,7 @@ class VerbHandler:
         has_fire = False
         for item_id in self.game.state.objects_held_by("player"):
             item = self.game.world.get_object(item_id)
-            if item and item.id in ["match", "torch"]:
+            if item and item.id in _FIRE_SOURCES:
                 item_state = self.game.state.get_object_state(item.id)
                 if item_state.flags1 & ObjectFlag1.ONBT:
                     has_fire = True
@@ -1896,7 +1924,7 @@ class VerbHandler:
         room = self.game.world.get_room(self.game.state.current_room)
 
         # Special case: in temple
-        if room and room.id in ["temp1", "temp2"]:
+        if room and room.id in _TEMPLE_ROOMS:
             return VerbResult(
                 success=True,
                 message="Your prayer is answered by a faint humming sound.",
@@ -1970,6 +1998,13 @@ class VerbHandler:
             end_turn=False,
         )
 
+    def _say_fool(self, cmd: ParsedCommand) -> VerbResult:
+        """Respond to the classic adventure magic words."""
+        return VerbResult(
+            success=True,
+            message="A hollow voice says 'Fool.'",
+        )
+
     def do_say(self, cmd: ParsedCommand) -> VerbResult:
         """Handle SAY command."""
         if not cmd.direct_object:
@@ -1982,14 +2017,9 @@ class VerbHandler:
         # Check for magic words
         word = cmd.direct_object.lower()
 
-        if word in ["odysseus", "ulysses"]:
-            return self.do_odysseus(cmd)
-
-        if word in ["xyzzy", "plugh", "plover"]:
-            return VerbResult(
-                success=True,
-                message="A hollow voice says 'Fool.'",
-            )
+        magic = self._MAGIC_WORDS.get(word)
+        if magic is not None:
+            return getattr(self, magic)(cmd)
 
         # Check for room-specific say actions
         room_result = self.game.room_actions.on_action(
@@ -1,6 +1,7 @@
 """World management for PyMeshZork - rooms, navigation, and map."""
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from pymeshzork.engine.models import (
     Direction,
@@ -10,10 +11,10 @@ from pymeshzork.engine.models import (
     Room,
     RoomFlag,
 )
-from pymeshzork.engine.state import GameState, ObjectState
+from pymeshzork.engine.state import PUZZLE_FLAG_NAMES, GameState, ObjectState
 
 
-@dataclass
+@dataclass(slots=True)
 class World:
     """Manages the game world - rooms, objects, and navigation."""
 
@@ -21,8 +22,14 @@ class World:
     objects: dict[str, Object] = field(default_factory=dict)
     messages: dict[str, str] = field(default_factory=dict)
 
-    # Direction name mappings
-    DIRECTION_NAMES: dict[str, Direction] = field(default_factory=lambda: {
+    # IDs of objects flagged as doors (DOORBT), maintained by add_object
+    door_ids: frozenset[str] = field(default_factory=frozenset)
+
+    # IDs of naturally lit (RLIGHT) rooms, maintained by add_room
+    lit_room_ids: frozenset[str] = field(default_factory=frozenset)
+
+    # Direction name mappings (shared by all worlds, not per-instance fields)
+    DIRECTION_NAMES: ClassVar[dict[str, Direction]] = {
         "n": Direction.NORTH,
         "north": Direction.NORTH,
         "s": Direction.SOUTH,
@@ -48,9 +55,9 @@ class World:
         "exit": Direction.EXIT,
         "out": Direction.EXIT,
         "leave": Direction.EXIT,
-    })
+    }
 
-    DIRECTION_DISPLAY: dict[Direction, str] = field(default_factory=lambda: {
+    DIRECTION_DISPLAY: ClassVar[dict[Direction, str]] = {
         Direction.NORTH: "north",
         Direction.SOUTH: "south",
         Direction.EAST: "east",
@@ -63,15 +70,25 @@ class World:
         Direction.DOWN: "down",
         Direction.ENTER: "in",
         Direction.EXIT: "out",
-    })
+    }
 
     def add_room(self, room: Room) -> None:
         """Add a room to the world."""
         self.rooms[room.id] = room
+        room.index_exits()
+        if room.flags & RoomFlag.RLIGHT:
+            self.lit_room_ids = self.lit_room_ids | {room.id}
+        elif room.id in self.lit_room_ids:
+            self.lit_room_ids = self.lit_room_ids - {room.id}
 
     def add_object(self, obj: Object) -> None:
         """Add an object to the world."""
         self.objects[obj.id] = obj
+        obj._search_tokens = tuple(s.lower() for s in (obj.name, *obj.synonyms))
+        if obj.is_door():
+            self.door_ids = self.door_ids | {obj.id}
+        elif obj.id in self.door_ids:
+            self.door_ids = self.door_ids - {obj.id}
 
     def get_room(self, room_id: str) -> Room | None:
         """Get a room by ID."""
@@ -87,22 +104,28 @@ class World:
 
     def parse_direction(self, direction_str: str) -> Direction | None:
         """Parse a direction string to a Direction enum."""
-        return self.DIRECTION_NAMES.get(direction_str.lower())
+        # Parser output is already lowercase; only fold case on a miss
+        direction = World.DIRECTION_NAMES.get(direction_str)
+        if direction is None:
+            direction = World.DIRECTION_NAMES.get(direction_str.lower())
+        return direction
 
     def direction_name(self, direction: Direction) -> str:
         """Get display name for a direction."""
-        return self.DIRECTION_DISPLAY.get(direction, "unknown")
+        return World.DIRECTION_DISPLAY.get(direction, "unknown")
 
     def find_exit(self, room: Room, direction: Direction) -> Exit | None:
         """Find an exit from a room in a given direction."""
-        for exit in room.exits:
-            if exit.direction == direction:
-                return exit
-        return None
+        exits = room._exits_by_dir
+        if exits is None:
+            exits = room.index_exits()
+        return exits.get(direction)
 
     def get_available_exits(self, room: Room) -> list[Exit]:
         """Get all available exits from a room."""
-        return [e for e in room.exits if e.exit_type != ExitType.NO_EXIT]
+        if room._available_exits is None:
+            room.index_exits()
+        return list(room._available_exits)
 
     def can_move(
         self,
@@ -143,17 +166,18 @@ class World:
 
     def _evaluate_condition(self, state: GameState, condition: str) -> bool:
         """Evaluate a puzzle condition for conditional exits."""
-        # Check game flags first
+        # Check packed puzzle flags first
+        puzzle_flag = PUZZLE_FLAG_NAMES.get(condition)
+        if puzzle_flag is not None:
+            return bool(state.puzzle_flags & puzzle_flag)
+
+        # Then named game flags
         if hasattr(state.flags, condition):
             return getattr(state.flags, condition)
 
         # Check specific conditions that may be tracked elsewhere
         condition_handlers = {
-            "rug_moved": lambda: state.flags.rug_moved,
             "troll_gone": lambda: state.flags.trollf,
-            "grate_open": lambda: state.flags.grate_open,
-            "rope_tied": lambda: state.flags.rope_tied,
-            "gates_open": lambda: state.flags.gates_open,
             "cyclops_gone": lambda: state.flags.cyclof,
             "rainbow_solid": lambda: state.flags.rainbf,
         }
@@ -227,44 +251,37 @@ class World:
         if not self.is_room_lit(state, room):
             return "It is pitch black. You are likely to be eaten by a grue."
 
-        # Build description
-        parts = [room.name]
-
         # Description
         if force_long or not room_state.is_visited() or not state.flags.brieff:
-            parts.append(room.description_first)
+            description = room.description_first
         else:
-            parts.append(room.description_short)
+            description = room.description_short
 
         # List objects in room
         objects_here = self.get_visible_objects_in_room(state, room.id)
-        if objects_here:
-            for obj in objects_here:
-                if obj.description:
-                    parts.append(obj.description)
+        if not objects_here:
+            return f"{room.name}\n{description}"
 
-        return "\n".join(parts)
+        return "\n".join((
+            room.name,
+            description,
+            *(obj.description for obj in objects_here if obj.description),
+        ))
 
     def is_room_lit(self, state: GameState, room: Room) -> bool:
         """Check if a room is currently lit."""
         # Room has natural light
-        if room.flags & RoomFlag.RLIGHT:
+        if room.id in self.lit_room_ids:
             return True
 
-        # Check for light sources in player's inventory
-        for obj_id in state.objects_held_by("player"):
+        # Only objects that are switched on can light the room; there are
+        # rarely more than one or two, so check those rather than every
+        # object in the inventory and the room
+        for obj_id in state.lit_objects():
             obj = self.get_object(obj_id)
             if obj and obj.is_light_source():
                 obj_state = state.get_object_state(obj_id)
-                if obj.is_on(obj_state):
-                    return True
-
-        # Check for light sources in room
-        for obj_id in state.objects_in_room(room.id):
-            obj = self.get_object(obj_id)
-            if obj and obj.is_light_source():
-                obj_state = state.get_object_state(obj_id)
-                if obj.is_on(obj_state):
+                if obj_state.is_held_by("player") or obj_state.is_in_room(room.id):
                     return True
 
         return False
@@ -275,21 +292,19 @@ class World:
         room_id: str,
     ) -> list[Object]:
         """Get all visible objects in a room."""
-        result = []
-        for obj_id in state.objects_in_room(room_id):
-            obj = self.get_object(obj_id)
-            if obj and obj.is_visible():
-                result.append(obj)
-        return result
+        objects = self.objects
+        return [
+            obj for obj_id in state.objects_in_room(room_id)
+            if (obj := objects.get(obj_id)) is not None and obj.is_visible()
+        ]
 
     def get_inventory(self, state: GameState, actor_id: str = "player") -> list[Object]:
         """Get objects held by an actor."""
-        result = []
-        for obj_id in state.objects_held_by(actor_id):
-            obj = self.get_object(obj_id)
-            if obj:
-                result.append(obj)
-        return result
+        objects = self.objects
+        return [
+            obj for obj_id in state.objects_held_by(actor_id)
+            if (obj := objects.get(obj_id)) is not None
+        ]
 
     def find_object_by_name(
         self,
@@ -310,11 +325,13 @@ class World:
         if search_room:
             candidate_ids.update(state.objects_in_room(state.current_room))
 
+        objects = self.objects
+
         # Also search inside open containers in the room and inventory
         if search_containers:
             container_ids = list(candidate_ids)  # Copy current candidates
             for container_id in container_ids:
-                container = self.get_object(container_id)
+                container = objects.get(container_id)
                 if container and container.is_container():
                     container_state = state.get_object_state(container_id)
                     # Check if container is open (or transparent)
@@ -323,20 +340,13 @@ class World:
                         candidate_ids.update(state.objects_in_container(container_id))
 
         for obj_id in candidate_ids:
-            obj = self.get_object(obj_id)
+            obj = objects.get(obj_id)
             if not obj or not obj.is_visible():
                 continue
 
-            # Check main name
-            if name_lower in obj.name.lower():
+            # Check main name and synonyms
+            if any(name_lower in token for token in obj._search_tokens):
                 matches.append(obj)
-                continue
-
-            # Check synonyms
-            for syn in obj.synonyms:
-                if name_lower in syn.lower():
-                    matches.append(obj)
-                    break
 
         return matches
 
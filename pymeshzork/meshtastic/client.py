@@ -1,12 +1,14 @@
 """Base client interface for Meshtastic multiplayer connections."""
 
 import hashlib
+import itertools
 import threading
 import time
 from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Callable
 
 from pymeshzork.meshtastic.protocol import (
@@ -25,6 +27,16 @@ from pymeshzork.meshtastic.protocol import (
 )
 
 
+# How far behind a player's latest sequence a skipped number is still accepted
+_DEDUP_WINDOW = 1024
+
+
+@lru_cache(maxsize=256)
+def _player_id_from_name(name: str) -> str:
+    """Hash a player name to a 6-character hex ID."""
+    return hashlib.blake2b(name.encode("utf-8"), digest_size=3).hexdigest()
+
+
 class ConnectionState(Enum):
     """Connection state for the client."""
 
@@ -35,13 +47,14 @@ class ConnectionState(Enum):
     ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuedMessage:
     """A message queued for sending."""
 
     message: GameMessage
     attempts: int = 0
     queued_at: float = field(default_factory=time.time)
+    encoded: bytes | None = None  # Wire form, encoded once when queued
 
 
 class MeshtasticClient(ABC):
@@ -66,9 +79,12 @@ class MeshtasticClient(ABC):
         self._state_lock = threading.Lock()
 
         # Message handling
-        self._sequence = 0
-        self._sequence_lock = threading.Lock()
-        self._seen_sequences: dict[str, set[int]] = {}  # player_id -> seen sequences
+        # count.__next__ runs in C and is atomic under the GIL, so no lock
+        self._sequence = itertools.count(1)
+        # Deduplication: highest sequence seen per player, plus the numbers
+        # skipped below it that may still arrive out of order
+        self._last_sequence: dict[str, int] = {}
+        self._missing_sequences: dict[str, set[int]] = {}
 
         # Message queue for offline resilience
         self._outgoing_queue: deque[QueuedMessage] = deque(maxlen=100)
@@ -88,14 +104,20 @@ class MeshtasticClient(ABC):
 
     def _generate_player_id(self, name: str) -> str:
         """Generate a 6-character player ID from name."""
-        hash_bytes = hashlib.sha256(name.encode()).hexdigest()
-        return hash_bytes[:6]
+        return _player_id_from_name(name)
 
     def _next_sequence(self) -> int:
         """Get the next sequence number."""
-        with self._sequence_lock:
-            self._sequence += 1
-            return self._sequence
+        return next(self._sequence)
+
+    @property
+    def current_room(self) -> str:
+        """Get the room this client last announced."""
+        return self._current_room
+
+    @current_room.setter
+    def current_room(self, room_id: str) -> None:
+        self._current_room = room_id
 
     @property
     def state(self) -> ConnectionState:
@@ -105,14 +127,18 @@ class MeshtasticClient(ABC):
 
     def _set_state(self, state: ConnectionState) -> None:
         """Set connection state and notify callbacks."""
+        # Callbacks run outside the lock so they can query or change state
         with self._state_lock:
-            if self._state != state:
-                self._state = state
-                for callback in self._state_callbacks:
-                    try:
-                        callback(state)
-                    except Exception:
-                        pass
+            if self._state == state:
+                return
+            self._state = state
+            callbacks = tuple(self._state_callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(state)
+            except Exception:
+                pass
 
     def on_message(self, callback: Callable[[GameMessage], None]) -> None:
         """Register a callback for incoming messages."""
@@ -123,7 +149,23 @@ class MeshtasticClient(ABC):
         self._state_callbacks.append(callback)
 
     def _handle_incoming(self, data: str | bytes) -> None:
-        """Handle an incoming message."""
+        """Handle an incoming payload of one or more messages.
+
+        Senders may pack several JSON messages into one packet, one per
+        line. JSON never contains a raw newline, so only JSON payloads are
+        split; MessagePack payloads are always a single message.
+        """
+        separator = "\n" if isinstance(data, str) else b"\n"
+        if data[:1] in ("{", b"{") and separator in data:
+            for line in data.split(separator):
+                if line:
+                    self._handle_single(line)
+        else:
+            # A single message goes to the decoder without being copied
+            self._handle_single(data)
+
+    def _handle_single(self, data: str | bytes) -> None:
+        """Handle one incoming message."""
         try:
             msg = decode_message(data)
 
@@ -131,21 +173,12 @@ class MeshtasticClient(ABC):
             if msg.player_id == self.player_id:
                 return
 
-            # Deduplicate by sequence number
-            if msg.player_id not in self._seen_sequences:
-                self._seen_sequences[msg.player_id] = set()
-
-            seen = self._seen_sequences[msg.player_id]
-            if msg.sequence in seen:
+            is_join = msg.type == MessageType.PLAYER_JOIN
+            if self._is_duplicate(msg.player_id, msg.sequence, is_join):
                 return  # Already processed
 
-            seen.add(msg.sequence)
-            # Keep only recent sequences to avoid memory growth
-            if len(seen) > 1000:
-                seen.clear()
-
-            # Notify callbacks
-            for callback in self._message_callbacks:
+            # Notify callbacks (snapshot, so callbacks may register others)
+            for callback in tuple(self._message_callbacks):
                 try:
                     callback(msg)
                 except Exception:
@@ -155,27 +188,93 @@ class MeshtasticClient(ABC):
             # Invalid message, ignore
             pass
 
-    def _queue_message(self, msg: GameMessage) -> None:
-        """Queue a message for sending."""
+    def _is_duplicate(self, player_id: str, sequence: int, is_join: bool = False) -> bool:
+        """Record a player's sequence number and report whether it was seen before."""
+        last = self._last_sequence.get(player_id)
+
+        # A restarted peer counts from the start again: a join numbered below
+        # the last one seen, or a jump back past the window, is a new session
+        if last is not None and (
+            last - sequence > _DEDUP_WINDOW or (is_join and sequence < last)
+        ):
+            self._missing_sequences.pop(player_id, None)
+            last = None
+
+        # Common case: the next number in order
+        if last is None or sequence == last + 1:
+            self._last_sequence[player_id] = sequence
+            return False
+
+        missing = self._missing_sequences.setdefault(player_id, set())
+        if sequence > last:
+            # Skipped ahead; remember the gap so late arrivals are accepted
+            missing.update(range(max(last + 1, sequence - _DEDUP_WINDOW), sequence))
+            if len(missing) > _DEDUP_WINDOW:
+                floor = sequence - _DEDUP_WINDOW
+                missing.difference_update([s for s in missing if s < floor])
+            self._last_sequence[player_id] = sequence
+            return False
+
+        if sequence in missing:
+            missing.discard(sequence)  # Late, but not seen before
+            return False
+        return True
+
+    def _encode_message(self, msg: GameMessage) -> bytes:
+        """Encode a message to its wire form for this transport."""
+        return encode_message(msg)
+
+    def _queue_message(self, msg: GameMessage, encoded: bytes | None = None) -> None:
+        """Queue a message for sending.
+
+        Args:
+            msg: The message to queue.
+            encoded: The message's wire form, if already encoded.
+        """
+        if encoded is None:
+            encoded = self._encode_message(msg)
         with self._queue_lock:
-            self._outgoing_queue.append(QueuedMessage(message=msg))
+            self._outgoing_queue.append(QueuedMessage(message=msg, encoded=encoded))
 
-    def _flush_queue(self) -> None:
-        """Attempt to send all queued messages."""
-        if self.state != ConnectionState.CONNECTED:
-            return
+    def _flush_queue(self) -> bool:
+        """Attempt to send all queued messages.
 
+        Returns:
+            True if every queued message was sent.
+        """
+        # Plain read: the state is a single reference, so no lock is needed
+        if self._state != ConnectionState.CONNECTED:
+            return False
+
+        # Take the pending messages under the lock, but send without it so
+        # send() from other threads isn't blocked behind network writes
         with self._queue_lock:
-            while self._outgoing_queue:
-                queued = self._outgoing_queue[0]
-                try:
-                    self._send_raw(encode_message(queued.message))
-                    self._outgoing_queue.popleft()
-                except Exception:
-                    queued.attempts += 1
-                    if queued.attempts >= 3:
-                        self._outgoing_queue.popleft()  # Give up after 3 attempts
-                    break
+            to_send = list(self._outgoing_queue)
+            self._outgoing_queue.clear()
+
+        for i, queued in enumerate(to_send):
+            try:
+                self._send_raw(queued.encoded or self._encode_message(queued.message))
+            except Exception:
+                queued.attempts += 1
+                remaining = to_send[i:] if queued.attempts < 3 else to_send[i + 1:]
+                # Put unsent messages back ahead of anything queued meanwhile
+                with self._queue_lock:
+                    self._outgoing_queue.extendleft(reversed(remaining))
+                return False
+
+        return True
+
+    def take_queued(self) -> list[GameMessage]:
+        """Remove and return the messages still waiting to be sent, in order.
+
+        Lets a caller hand messages this client could not deliver to
+        another transport.
+        """
+        with self._queue_lock:
+            queued = [q.message for q in self._outgoing_queue]
+            self._outgoing_queue.clear()
+        return queued
 
     def _start_heartbeat(self) -> None:
         """Start the heartbeat thread."""
@@ -218,11 +317,12 @@ class MeshtasticClient(ABC):
         pass
 
     @abstractmethod
-    def _send_raw(self, data: str) -> None:
+    def _send_raw(self, data: bytes) -> None:
         """Send raw data over the connection.
 
         Args:
-            data: JSON-encoded message string.
+            data: Encoded message bytes (JSON or MessagePack), as produced
+                by _encode_message().
         """
         pass
 
@@ -241,16 +341,24 @@ class MeshtasticClient(ABC):
         """
         msg.sequence = self._next_sequence()
 
-        if self.state == ConnectionState.CONNECTED:
-            try:
-                self._send_raw(encode_message(msg))
-                return True
-            except Exception:
-                self._queue_message(msg)
-                return False
-        else:
-            self._queue_message(msg)
-            return False
+        # Everything goes through the queue, so a connection dropping between
+        # a state check and the write can't reorder or lose messages
+        self._queue_message(msg)
+        return self._flush_queue()
+
+    def send_batch(self, messages: list[GameMessage]) -> int:
+        """Send several game messages in one call.
+
+        Subclasses may override this to coalesce messages on the wire; the
+        default sends each message in turn.
+
+        Args:
+            messages: The messages to send, in order.
+
+        Returns:
+            Number of messages sent immediately (the rest were queued).
+        """
+        return sum(self.send(msg) for msg in messages)
 
     def send_join(self, room_id: str) -> bool:
         """Announce joining the game."""
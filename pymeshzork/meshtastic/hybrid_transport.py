@@ -9,25 +9,42 @@ Architecture:
     - Hybrid mode: Both active with deduplication
 
 Message Deduplication:
-    - Each message has unique ID: {player_id}:{sequence_number}
+    - Each message has unique ID: (player_id, sequence_number)
     - LRU cache tracks recently seen message IDs
     - Messages received from any transport are deduplicated
     - Outgoing messages sent via primary transport only
 """
 
+import functools
+import itertools
 import logging
+import math
 import threading
 import time
-from collections import OrderedDict
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable, Any
+from typing import Callable, Any, Hashable
 
+from pymeshzork.config import Config, get_config
 from pymeshzork.meshtastic.client import MeshtasticClient, ConnectionState
+from pymeshzork.meshtastic.mqtt_client import MQTTClient
 from pymeshzork.meshtastic.protocol import GameMessage
+from pymeshzork.meshtastic.serial_client import SerialClient, list_serial_devices
 
 logger = logging.getLogger(__name__)
 
+# USB vendor IDs of Meshtastic boards: CP210x, CH9102, ESP32
+_MESHTASTIC_VIDS = frozenset({0x10C4, 0x1A86, 0x303A})
+
+# Seconds a USB serial device scan is reused before rescanning
+_SERIAL_SCAN_TTL = 5
+
+# LRUCache reaps expired entries every this many inserts...
+_SWEEP_INTERVAL = 64
+# ...looking at this many of the oldest entries
+_SWEEP_SAMPLE = 5
+
 
 class TransportType(Enum):
     """Available transport types."""
@@ -58,32 +75,82 @@ class LRUCache:
         """
         self.maxsize = maxsize
         self.ttl = ttl
-        self._cache: OrderedDict[str, float] = OrderedDict()
+        # Expiries are whole seconds: int compares are cheap and entries
+        # live between ttl and ttl + 1 seconds
+        self._ttl_ticks = max(1, math.ceil(ttl))
+        # When full, evict down to this size in one pass
+        self._low_watermark = max(1, int(maxsize * 0.75))
+        # Key -> expiry second. Plain dicts keep insertion order; recency is
+        # only updated by add()
+        self._cache: dict[Hashable, int] = {}
         self._lock = threading.Lock()
+        self._inserts = 0
+        # Monotonic clock: cheap, and immune to wall-clock steps expiring entries
+        self._now = time.monotonic
 
-    def __contains__(self, key: str) -> bool:
+    def __contains__(self, key: Hashable) -> bool:
         """Check if key is in cache and not expired."""
+        # A single dict read is atomic, so the common path takes no lock
+        expires = self._cache.get(key)
+        if expires is None:
+            return False
+        # Check TTL
+        if expires < int(self._now()):
+            with self._lock:
+                # Only drop it if add() hasn't refreshed it in the meantime
+                if self._cache.get(key) == expires:
+                    del self._cache[key]
+            return False
+        return True
+
+    def add(self, key: Hashable) -> None:
+        """Add key to cache."""
         with self._lock:
-            if key not in self._cache:
-                return False
-            # Check TTL
-            if time.time() - self._cache[key] > self.ttl:
-                del self._cache[key]
+            self._insert(key, int(self._now()))
+
+    def check_and_add(self, key: Hashable) -> bool:
+        """Add key to cache unless it is already present and unexpired.
+
+        Returns:
+            True if the key was newly added, False if it was already seen.
+        """
+        with self._lock:
+            now = int(self._now())
+            # Lookup and insert in one C-level call; the cache only grows if
+            # the key was new
+            size = len(self._cache)
+            expires = self._cache.setdefault(key, now + self._ttl_ticks)
+            if len(self._cache) != size:
+                self._after_insert(now)
+                return True
+            if expires >= now:
                 return False
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
+            self._insert(key, now)
             return True
 
-    def add(self, key: str) -> None:
-        """Add key to cache."""
-        with self._lock:
-            if key in self._cache:
-                self._cache.move_to_end(key)
-            else:
-                self._cache[key] = time.time()
-                # Evict oldest if over capacity
-                while len(self._cache) > self.maxsize:
-                    self._cache.popitem(last=False)
+    def _insert(self, key: Hashable, now: int) -> None:
+        """Insert or refresh a key and keep the cache bounded. Caller holds the lock."""
+        # Re-insert so the key moves to the end (most recently used)
+        self._cache.pop(key, None)
+        self._cache[key] = now + self._ttl_ticks
+        self._after_insert(now)
+
+    def _after_insert(self, now: int) -> None:
+        """Sweep and evict after an insert. Caller holds the lock."""
+        self._inserts += 1
+        if self._inserts % _SWEEP_INTERVAL == 0:
+            # Reap expired entries from the old end so stale IDs don't sit
+            # in memory until the cache fills up
+            for old_key in list(itertools.islice(self._cache, _SWEEP_SAMPLE)):
+                if self._cache[old_key] < now:
+                    del self._cache[old_key]
+
+        if len(self._cache) > self.maxsize:
+            # Drop a batch down to the low watermark so eviction runs once
+            # per maxsize/4 inserts rather than on every insert
+            excess = len(self._cache) - self._low_watermark
+            for old_key in list(itertools.islice(self._cache, excess)):
+                del self._cache[old_key]
 
     def clear(self) -> None:
         """Clear the cache."""
@@ -109,6 +176,10 @@ class HybridConfig:
     auto_detect: bool = True
     detection_interval: float = 30  # Re-check availability every 30s
 
+    # Outbound batching: messages sent within this window go out together
+    batch_window: float = 0.02  # 20ms
+    batch_size: int = 8  # Flush early once this many are waiting
+
     # Fallback behavior
     enable_fallback: bool = True
     mqtt_as_bridge: bool = True  # Use MQTT to bridge LoRa islands
@@ -140,27 +211,67 @@ class HybridTransport:
         """
         self.player_name = player_name
         self.config = config or HybridConfig()
+        # Position of each transport in the priority list (0 = most preferred)
+        self._priority_rank: dict[TransportType, int] = {
+            tt: i for i, tt in enumerate(self.config.transport_priority)
+        }
+
+        # Client constructors per transport type (native is not supported yet)
+        self._client_factories: dict[TransportType, Callable[[Config], MeshtasticClient]] = {
+            TransportType.MESHTASTIC_SERIAL: self._create_serial_client,
+            TransportType.MQTT: self._create_mqtt_client,
+        }
 
-        # Active transports
+        # Active transports. Copy-on-write: replaced (never mutated) under
+        # _lock, so readers can take a snapshot reference and iterate it
+        # without locking
         self._transports: dict[TransportType, MeshtasticClient] = {}
-        self._transport_status: dict[TransportType, TransportStatus] = {}
+        # Transport status as parallel arrays indexed by tt.value - 1; a
+        # last_check of 0 means the transport has never been checked
+        slots = len(TransportType)
+        self._status_available: list[bool] = [False] * slots
+        self._status_connected: list[bool] = [False] * slots
+        self._status_last_check: list[float] = [0.0] * slots
+        self._status_error: list[str] = [""] * slots
         self._primary_transport: TransportType | None = None
+        # Connected clients to try for sending, primary first; rebuilt on
+        # every transport transition by _refresh_send_order
+        self._send_order: tuple[MeshtasticClient, ...] = ()
+
+        # Outbound messages waiting for the flush thread
+        self._outbox: deque[GameMessage] = deque()
+        self._outbox_ready = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._stop_flush = threading.Event()
+
+        self._serial_scan_cache: tuple[float, list[dict]] | None = None
 
         # Message deduplication
         self._seen_messages = LRUCache(
             maxsize=self.config.dedup_cache_size,
             ttl=self.config.dedup_ttl,
         )
-        self._duplicate_count = 0
+        # Duplicates seen per transport, indexed like the status arrays; each
+        # slot is only written by that transport's receive thread
+        self._duplicate_counts: list[int] = [0] * slots
+
+        # Per-transport receive callbacks; partials add no Python frame per packet
+        self._dispatchers: dict[TransportType, Callable[[GameMessage], None]] = {
+            tt: functools.partial(self._handle_message, source=tt)
+            for tt in TransportType
+        }
 
         # Callbacks
-        self._message_callbacks: list[Callable[[GameMessage], None]] = []
+        # Tuple swapped on registration, so dispatch reads it without a lock
+        self._message_callbacks: tuple[Callable[[GameMessage], None], ...] = ()
         self._state_callbacks: list[Callable[[TransportType, ConnectionState], None]] = []
 
         # Threading
         self._lock = threading.Lock()
         self._detection_thread: threading.Thread | None = None
         self._stop_detection = threading.Event()
+        # Set to run a detection pass early (client state change or shutdown)
+        self._wake_detection = threading.Event()
 
     @property
     def is_connected(self) -> bool:
@@ -185,7 +296,8 @@ class HybridTransport:
 
     def on_message(self, callback: Callable[[GameMessage], None]) -> None:
         """Register callback for incoming messages (after deduplication)."""
-        self._message_callbacks.append(callback)
+        with self._lock:
+            self._message_callbacks = (*self._message_callbacks, callback)
 
     def on_state_change(
         self,
@@ -197,76 +309,138 @@ class HybridTransport:
     def detect_available_transports(self) -> list[TransportType]:
         """Detect which transports are available.
 
+        Results younger than half the detection interval are reused rather
+        than probed again.
+
         Returns:
             List of available transport types.
         """
-        available = []
+        now = time.time()
+        max_age = self.config.detection_interval / 2
 
-        # Check for Meshtastic Native (meshtasticd running)
-        if self._check_meshtastic_native():
-            available.append(TransportType.MESHTASTIC_NATIVE)
-            self._update_status(TransportType.MESHTASTIC_NATIVE, available=True)
-        else:
-            self._update_status(TransportType.MESHTASTIC_NATIVE, available=False)
+        last_check = self._status_last_check
+
+        def is_fresh(tt: TransportType) -> bool:
+            return now - last_check[tt.value - 1] < max_age
+
+        results: dict[TransportType, bool] = {}
+
+        # Probe meshtasticd and the MQTT broker together: one non-blocking
+        # round instead of back-to-back blocking connects
+        endpoints: dict[TransportType, tuple[str, int]] = {}
+        if not is_fresh(TransportType.MESHTASTIC_NATIVE):
+            endpoints[TransportType.MESHTASTIC_NATIVE] = ("localhost", 4403)
+        if not is_fresh(TransportType.MQTT):
+            mqtt_endpoint = self._mqtt_endpoint()
+            if mqtt_endpoint is None:
+                results[TransportType.MQTT] = False
+            else:
+                endpoints[TransportType.MQTT] = mqtt_endpoint
+        results.update(self._probe_tcp(endpoints, timeout=2))
 
         # Check for USB Meshtastic device
-        if self._check_meshtastic_serial():
-            available.append(TransportType.MESHTASTIC_SERIAL)
-            self._update_status(TransportType.MESHTASTIC_SERIAL, available=True)
-        else:
-            self._update_status(TransportType.MESHTASTIC_SERIAL, available=False)
-
-        # Check MQTT broker connectivity
-        if self._check_mqtt():
-            available.append(TransportType.MQTT)
-            self._update_status(TransportType.MQTT, available=True)
-        else:
-            self._update_status(TransportType.MQTT, available=False)
-
-        return available
-
-    def _check_meshtastic_native(self) -> bool:
-        """Check if meshtasticd is running and accessible."""
+        if not is_fresh(TransportType.MESHTASTIC_SERIAL):
+            results[TransportType.MESHTASTIC_SERIAL] = self._check_meshtastic_serial()
+
+        for tt, available in results.items():
+            self._update_status(tt, available=available)
+
+        available = self._status_available
+        return [tt for tt in TransportType if available[tt.value - 1]]
+
+    def _probe_tcp(
+        self,
+        endpoints: dict[TransportType, tuple[str, int]],
+        timeout: float,
+    ) -> dict[TransportType, bool]:
+        """Check which TCP endpoints accept connections, probing concurrently.
+
+        Args:
+            endpoints: Host and port to probe for each transport.
+            timeout: Overall time budget in seconds for all probes.
+
+        Returns:
+            Whether each transport's endpoint accepted a connection.
+        """
+        import errno
+        import selectors
+        import socket
+
+        results = {tt: False for tt in endpoints}
+        # Name lookups count against the same budget as the connects
+        deadline = time.monotonic() + timeout
+        selector = selectors.DefaultSelector()
         try:
-            import socket
-            # Try to connect to meshtasticd TCP port (default 4403)
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(('localhost', 4403))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
+            for tt, (host, port) in endpoints.items():
+                if time.monotonic() >= deadline:
+                    break
+                sock = None
+                try:
+                    try:
+                        # IP literals resolve without touching DNS
+                        infos = socket.getaddrinfo(
+                            host, port, type=socket.SOCK_STREAM,
+                            flags=socket.AI_NUMERICHOST,
+                        )
+                    except socket.gaierror:
+                        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+                    family, type_, proto, _, sockaddr = infos[0]
+                    sock = socket.socket(family, type_, proto)
+                    sock.setblocking(False)
+                    result = sock.connect_ex(sockaddr)
+                except Exception:
+                    if sock is not None:
+                        sock.close()
+                    continue
+                if result == 0:
+                    results[tt] = True
+                    sock.close()
+                elif result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    selector.register(sock, selectors.EVENT_WRITE, tt)
+                else:
+                    sock.close()
+
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    sock = key.fileobj
+                    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    results[key.data] = err == 0
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+
+        return results
 
     def _check_meshtastic_serial(self) -> bool:
         """Check if a USB Meshtastic device is connected."""
         try:
-            from pymeshzork.meshtastic.serial_client import list_serial_devices
-            devices = list_serial_devices()
+            now = time.time()
+            cached = self._serial_scan_cache
+            if cached is not None and now - cached[0] < _SERIAL_SCAN_TTL:
+                devices = cached[1]
+            else:
+                devices = list_serial_devices()
+                self._serial_scan_cache = (now, devices)
             # Look for known Meshtastic device VID/PIDs
-            for dev in devices:
-                if dev.get('vid') in [0x10C4, 0x1A86, 0x303A]:  # CP210x, CH9102, ESP32
-                    return True
-            return False
+            return any(dev.get('vid') in _MESHTASTIC_VIDS for dev in devices)
         except Exception:
             return False
 
-    def _check_mqtt(self) -> bool:
-        """Check if MQTT broker is reachable."""
+    def _mqtt_endpoint(self) -> tuple[str, int] | None:
+        """Get the configured MQTT broker address, or None if MQTT is disabled."""
         try:
-            from pymeshzork.config import get_config
             config = get_config()
             if not config.mqtt.enabled:
-                return False
-
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((config.mqtt.broker, config.mqtt.port))
-            sock.close()
-            return result == 0
+                return None
+            return (config.mqtt.broker, config.mqtt.port)
         except Exception:
-            return False
+            return None
 
     def _update_status(
         self,
@@ -276,20 +450,26 @@ class HybridTransport:
         error: str | None = None,
     ) -> None:
         """Update transport status."""
-        if transport_type not in self._transport_status:
-            self._transport_status[transport_type] = TransportStatus(
-                transport_type=transport_type
-            )
-
-        status = self._transport_status[transport_type]
-        status.last_check = time.time()
+        i = transport_type.value - 1
+        self._status_last_check[i] = time.time()
 
         if available is not None:
-            status.available = available
+            self._status_available[i] = available
         if connected is not None:
-            status.connected = connected
+            self._status_connected[i] = connected
         if error is not None:
-            status.error_message = error
+            self._status_error[i] = error
+
+    def get_transport_status(self, transport_type: TransportType) -> TransportStatus:
+        """Get a snapshot of one transport's status."""
+        i = transport_type.value - 1
+        return TransportStatus(
+            transport_type=transport_type,
+            available=self._status_available[i],
+            connected=self._status_connected[i],
+            last_check=self._status_last_check[i],
+            error_message=self._status_error[i],
+        )
 
     def connect(self, transport_types: list[TransportType] | None = None) -> bool:
         """Connect to transports.
@@ -315,9 +495,10 @@ class HybridTransport:
             try:
                 client = self._create_client(tt)
                 if client and client.connect():
-                    self._transports[tt] = client
+                    self._add_transport(tt, client)
                     self._update_status(tt, connected=True)
-                    client.on_message(lambda msg, src=tt: self._handle_message(msg, src))
+                    client.on_message(self._dispatchers[tt])
+                    client.on_state_change(self._on_client_state)
 
                     logger.info(f"Connected to {tt.name}")
                     connected_any = True
@@ -330,86 +511,189 @@ class HybridTransport:
                 logger.error(f"Failed to connect {tt.name}: {e}")
                 self._update_status(tt, connected=False, error=str(e))
 
+        self._refresh_send_order()
+
         # Start detection thread for auto-reconnect
         if self.config.auto_detect and not self._detection_thread:
             self._start_detection_thread()
 
         return connected_any
 
+    def _add_transport(self, transport_type: TransportType, client: MeshtasticClient) -> None:
+        """Publish a connected client by swapping in an updated transports dict."""
+        with self._lock:
+            self._transports = {**self._transports, transport_type: client}
+
     def _create_client(self, transport_type: TransportType) -> MeshtasticClient | None:
         """Create a client for the given transport type."""
-        from pymeshzork.config import get_config
-        config = get_config()
-
-        if transport_type == TransportType.MESHTASTIC_NATIVE:
-            # TODO: Implement MeshtasticNativeClient
-            logger.warning("Meshtastic Native client not yet implemented")
+        factory = self._client_factories.get(transport_type)
+        if factory is None:
+            if transport_type == TransportType.MESHTASTIC_NATIVE:
+                # TODO: Implement MeshtasticNativeClient
+                logger.warning("Meshtastic Native client not yet implemented")
             return None
+        return factory(get_config())
 
-        elif transport_type == TransportType.MESHTASTIC_SERIAL:
-            from pymeshzork.meshtastic.serial_client import SerialClient
-            return SerialClient(
-                player_name=self.player_name,
-                port=config.serial.port or None,
-            )
-
-        elif transport_type == TransportType.MQTT:
-            from pymeshzork.meshtastic.mqtt_client import MQTTClient
-            return MQTTClient(
-                player_name=self.player_name,
-                broker=config.mqtt.broker,
-                port=config.mqtt.port,
-                username=config.mqtt.username or None,
-                password=config.mqtt.password or None,
-                use_tls=config.mqtt.use_tls,
-            )
+    def _create_serial_client(self, config: Config) -> MeshtasticClient:
+        """Create a USB serial Meshtastic client."""
+        return SerialClient(
+            player_name=self.player_name,
+            port=config.serial.port or None,
+        )
 
-        return None
+    def _create_mqtt_client(self, config: Config) -> MeshtasticClient:
+        """Create an MQTT client for the configured broker."""
+        return MQTTClient(
+            player_name=self.player_name,
+            broker=config.mqtt.broker,
+            port=config.mqtt.port,
+            username=config.mqtt.username or None,
+            password=config.mqtt.password or None,
+            use_tls=config.mqtt.use_tls,
+        )
 
     def disconnect(self) -> None:
         """Disconnect all transports."""
         self._stop_detection.set()
+        self._wake_detection.set()
         if self._detection_thread:
             self._detection_thread.join(timeout=2)
             self._detection_thread = None
 
-        for tt, client in self._transports.items():
+        # Deliver anything still waiting before the clients go away
+        self._stop_flush.set()
+        self._outbox_ready.set()
+        if self._flush_thread:
+            self._flush_thread.join(timeout=2)
+            self._flush_thread = None
+        self.flush()
+
+        with self._lock:
+            transports = self._transports
+            self._transports = {}
+            self._send_order = ()
+
+        for tt, client in transports.items():
             try:
                 client.disconnect()
             except Exception as e:
                 logger.debug(f"Error disconnecting {tt.name}: {e}")
 
-        self._transports.clear()
         self._primary_transport = None
 
     def send(self, message: GameMessage) -> bool:
-        """Send a message via the primary transport.
+        """Queue a message to go out via the primary transport.
+
+        Messages are coalesced for up to config.batch_window seconds and
+        handed to the transport together.
 
         Args:
             message: The game message to send.
 
         Returns:
-            True if sent successfully.
+            True if queued for a connected transport.
         """
-        if self._primary_transport is None:
-            logger.warning("No primary transport available")
+        if not self._send_order:
+            logger.warning("No connected transport available")
             return False
 
-        client = self._transports.get(self._primary_transport)
-        if client and client.state == ConnectionState.CONNECTED:
-            return client.send(message)
+        self._outbox.append(message)
+        waiting = len(self._outbox)
+        # Wake the flush thread for the first message of a burst, and again
+        # once a full batch is waiting
+        if waiting == 1 or waiting >= self.config.batch_size:
+            self._outbox_ready.set()
+        if self._flush_thread is None:
+            self._start_flush_thread()
+        return True
 
-        # Try fallback transports
-        if self.config.enable_fallback:
-            for tt in self.config.transport_priority:
-                if tt == self._primary_transport:
-                    continue
-                client = self._transports.get(tt)
-                if client and client.state == ConnectionState.CONNECTED:
-                    logger.debug(f"Using fallback transport: {tt.name}")
-                    return client.send(message)
+    def flush(self) -> int:
+        """Send all queued outbound messages now.
 
-        return False
+        Whatever a transport cannot send is taken back from it and offered
+        to the next one in the send order; the last transport keeps anything
+        it could not send queued for its reconnect.
+
+        Returns:
+            Number of messages sent immediately.
+        """
+        batch = []
+        while self._outbox:
+            try:
+                batch.append(self._outbox.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return 0
+
+        send_order = self._send_order
+        if not send_order:
+            logger.warning(f"Dropping {len(batch)} messages: no connected transport")
+            return 0
+
+        sent = 0
+        last = len(send_order) - 1
+        for i, client in enumerate(send_order):
+            sent += client.send_batch(batch)
+            if i == last:
+                break
+            batch = client.take_queued()
+            if not batch:
+                break
+            logger.debug(f"Falling back to next transport for {len(batch)} messages")
+        return sent
+
+    def _start_flush_thread(self) -> None:
+        """Start the background thread that sends batched messages."""
+        with self._lock:
+            if self._flush_thread is not None:
+                return
+            self._stop_flush.clear()
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop,
+                daemon=True,
+                name="transport-flush",
+            )
+            self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Send each burst of queued messages a batch window after it starts.
+
+        The thread sleeps until a message is queued, then gives the rest of
+        the burst config.batch_window seconds, or less if a batch fills.
+        """
+        while not self._stop_flush.is_set():
+            self._outbox_ready.wait()
+            self._outbox_ready.clear()
+            if (
+                not self._stop_flush.is_set()
+                and len(self._outbox) < self.config.batch_size
+            ):
+                self._outbox_ready.wait(self.config.batch_window)
+                self._outbox_ready.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Outbound flush error: {e}")
+
+    def _refresh_send_order(self) -> None:
+        """Rebuild the send order after a transport or primary change.
+
+        The primary transport comes first if connected, then (with fallback
+        enabled) the other connected transports in priority order.
+        """
+        with self._lock:
+            primary = self._primary_transport
+            connected = sorted(
+                (
+                    (tt, client) for tt, client in self._transports.items()
+                    if client.state == ConnectionState.CONNECTED
+                ),
+                key=lambda item: (item[0] != primary, self._priority_rank.get(item[0], 0)),
+            )
+            if not self.config.enable_fallback:
+                connected = [item for item in connected if item[0] == primary]
+            self._send_order = tuple(client for _, client in connected)
 
     def _handle_message(self, message: GameMessage, source: TransportType) -> None:
         """Handle incoming message with deduplication.
@@ -418,18 +702,15 @@ class HybridTransport:
             message: The received game message.
             source: Which transport delivered the message.
         """
-        # Generate message ID for deduplication
-        msg_id = f"{message.player_id}:{message.sequence}"
+        # Message ID for deduplication; a tuple avoids building a string per packet
+        msg_id = (message.player_id, message.sequence)
 
-        # Check if we've already seen this message
-        if msg_id in self._seen_messages:
-            self._duplicate_count += 1
-            logger.debug(f"Duplicate message from {source.name}: {msg_id}")
+        # Check if we've already seen this message, marking it seen if not
+        if not self._seen_messages.check_and_add(msg_id):
+            self._duplicate_counts[source.value - 1] += 1
+            logger.debug("Duplicate message from %s: %s", source.name, msg_id)
             return
 
-        # Mark as seen
-        self._seen_messages.add(msg_id)
-
         # Dispatch to callbacks
         for callback in self._message_callbacks:
             try:
@@ -437,9 +718,16 @@ class HybridTransport:
             except Exception as e:
                 logger.error(f"Message callback error: {e}")
 
+    def _on_client_state(self, state: ConnectionState) -> None:
+        """Update the send order and wake detection when a client's state changes."""
+        self._refresh_send_order()
+        if state != ConnectionState.CONNECTED:
+            self._wake_detection.set()
+
     def _start_detection_thread(self) -> None:
         """Start background thread for transport detection/reconnection."""
         self._stop_detection.clear()
+        self._wake_detection.clear()
         self._detection_thread = threading.Thread(
             target=self._detection_loop,
             daemon=True,
@@ -448,8 +736,16 @@ class HybridTransport:
         self._detection_thread.start()
 
     def _detection_loop(self) -> None:
-        """Background loop for detecting and reconnecting transports."""
-        while not self._stop_detection.wait(self.config.detection_interval):
+        """Background loop for detecting and reconnecting transports.
+
+        Runs every detection interval, or immediately when a connected
+        client reports a state change.
+        """
+        while True:
+            self._wake_detection.wait(self.config.detection_interval)
+            if self._stop_detection.is_set():
+                break
+            self._wake_detection.clear()
             try:
                 # Check for newly available transports
                 available = self.detect_available_transports()
@@ -461,30 +757,27 @@ class HybridTransport:
                         try:
                             client = self._create_client(tt)
                             if client and client.connect():
-                                self._transports[tt] = client
+                                self._add_transport(tt, client)
                                 self._update_status(tt, connected=True)
-                                client.on_message(
-                                    lambda msg, src=tt: self._handle_message(msg, src)
-                                )
+                                client.on_message(self._dispatchers[tt])
+                                client.on_state_change(self._on_client_state)
 
                                 # Update primary if higher priority
                                 if self._primary_transport is None:
                                     self._primary_transport = tt
-                                else:
-                                    current_idx = self.config.transport_priority.index(
-                                        self._primary_transport
-                                    )
-                                    new_idx = self.config.transport_priority.index(tt)
-                                    if new_idx < current_idx:
-                                        self._primary_transport = tt
-                                        logger.info(f"Switched to higher priority: {tt.name}")
+                                elif (
+                                    self._priority_rank[tt]
+                                    < self._priority_rank[self._primary_transport]
+                                ):
+                                    self._primary_transport = tt
+                                    logger.info(f"Switched to higher priority: {tt.name}")
 
                         except Exception as e:
                             logger.debug(f"Failed to connect {tt.name}: {e}")
 
                 # Check for disconnected transports
-                for tt in list(self._transports.keys()):
-                    client = self._transports[tt]
+                transports = self._transports
+                for tt, client in transports.items():
                     if client.state != ConnectionState.CONNECTED:
                         logger.warning(f"Transport disconnected: {tt.name}")
                         self._update_status(tt, connected=False)
@@ -493,12 +786,13 @@ class HybridTransport:
                         if tt == self._primary_transport:
                             self._primary_transport = None
                             for candidate in self.config.transport_priority:
-                                if candidate in self._transports:
-                                    c = self._transports[candidate]
-                                    if c.state == ConnectionState.CONNECTED:
-                                        self._primary_transport = candidate
-                                        logger.info(f"Switched to: {candidate.name}")
-                                        break
+                                c = transports.get(candidate)
+                                if c is not None and c.state == ConnectionState.CONNECTED:
+                                    self._primary_transport = candidate
+                                    logger.info(f"Switched to: {candidate.name}")
+                                    break
+
+                self._refresh_send_order()
 
             except Exception as e:
                 logger.error(f"Detection loop error: {e}")
@@ -509,16 +803,20 @@ class HybridTransport:
         Returns:
             Dictionary with transport status information.
         """
+        available = self._status_available
+        connected = self._status_connected
+        errors = self._status_error
         return {
             "primary": self._primary_transport.name if self._primary_transport else None,
             "connected": [tt.name for tt in self.connected_transports],
-            "duplicate_count": self._duplicate_count,
+            "duplicate_count": sum(self._duplicate_counts),
             "transports": {
                 tt.name: {
-                    "available": status.available,
-                    "connected": status.connected,
-                    "error": status.error_message,
+                    "available": available[i],
+                    "connected": connected[i],
+                    "error": errors[i],
                 }
-                for tt, status in self._transport_status.items()
+                for i, tt in enumerate(TransportType)
+                if self._status_last_check[i]
             },
         }
@@ -18,7 +18,11 @@ Pinout (Pi GPIO header):
   - Button C: GPIO12
 """
 
+import hashlib
 import logging
+import queue
+import random
+import socket
 import struct
 import threading
 import time
@@ -28,7 +32,9 @@ from pymeshzork.meshtastic.client import MeshtasticClient, ConnectionState
 from pymeshzork.meshtastic.protocol import (
     GameMessage,
     MessageType,
+    PACKED_AVAILABLE,
     encode_message,
+    encode_message_packed,
     decode_message,
 )
 
@@ -43,7 +49,20 @@ LORA_CODING_RATE = 5  # 4/5
 
 # Timing
 RECEIVE_TIMEOUT = 0.5  # seconds
+IRQ_PIN = 22  # BCM pin wired to the radio's DIO0 (packet done) line
+IRQ_WATCHDOG = 5.0  # Poll at least this often in case an edge is missed
 CHANNEL_ACTIVITY_TIMEOUT = 0.1  # CAD timeout
+CSMA_ATTEMPTS = 5  # Channel checks before transmitting anyway
+CSMA_SLOT = 0.01  # Backoff slot in seconds; the window doubles per busy check
+DISPLAY_MIN_INTERVAL = 0.1  # Seconds between TX/RX indicator redraws
+DISPLAY_FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+# Frame header: payload length + sender node ID
+_FRAME_HEADER = struct.Struct(">BH")
+
+# The RFM9x driver sends at most 252 bytes per packet, header included
+LORA_MAX_FRAME = 252
+LORA_MAX_PAYLOAD = LORA_MAX_FRAME - _FRAME_HEADER.size
 
 
 class LoRaClient(MeshtasticClient):
@@ -59,6 +78,7 @@ class LoRaClient(MeshtasticClient):
         frequency: float = LORA_FREQ,
         tx_power: int = LORA_TX_POWER,
         node_id: int | None = None,
+        packed: bool = False,
     ):
         """Initialize LoRa client.
 
@@ -67,6 +87,8 @@ class LoRaClient(MeshtasticClient):
             frequency: LoRa frequency in MHz (915.0 for US, 868.0 for EU).
             tx_power: Transmit power in dBm (5-23).
             node_id: Optional fixed node ID. If None, generates from MAC.
+            packed: Send MessagePack instead of JSON to save airtime
+                (requires msgspec on every node in range).
         """
         super().__init__(player_name)
 
@@ -74,34 +96,59 @@ class LoRaClient(MeshtasticClient):
         self.tx_power = min(23, max(5, tx_power))  # Clamp to valid range
         self._node_id = node_id
 
+        if packed and not PACKED_AVAILABLE:
+            logger.warning("msgspec not installed; sending JSON instead of MessagePack")
+            packed = False
+        self.packed = packed
+
         self._rfm9x = None
-        self._receive_thread: threading.Thread | None = None
+        # One thread owns the radio: it transmits queued frames and receives
+        self._radio_thread: threading.Thread | None = None
+        self._tx_queue: queue.SimpleQueue[bytes] = queue.SimpleQueue()
         self._running = False
-        self._radio_lock = threading.Lock()  # Protects access to _rfm9x
+        # Own backoff stream (seeded from the OS), independent of global random
+        self._rng = random.Random()
+
+        # Radio interrupt (optional); when set up, the radio thread sleeps
+        # until DIO0 fires or a frame is queued, instead of polling
+        self._irq = None
+        self._radio_wake = threading.Event()
 
         # OLED display (optional)
         self._display = None
         self._display_enabled = False
+        # Drawing surface and fonts, created once in _init_display
+        self._image = None
+        self._draw = None
+        self._font = None
+        self._font_small = None
+        self._last_display_update = 0.0
+        self._display_lock = threading.Lock()  # TX and RX threads both redraw
 
-        # Button callbacks
-        self._button_callbacks: dict[str, Callable[[], None]] = {}
+        # Bonnet buttons by name (gpiozero Button objects)
+        self._buttons: dict[str, object] = {}
 
     def _get_node_id(self) -> int:
         """Get or generate node ID."""
         if self._node_id is not None:
             return self._node_id
 
-        # Generate from hostname/MAC for consistency
+        # Generate from hostname for consistency across restarts
         try:
-            import socket
             hostname = socket.gethostname()
-            # Use hash of hostname, keep to 16 bits
-            return hash(hostname) & 0xFFFF
+            # Stable 16-bit digest; hash() is salted per process
+            digest = hashlib.blake2b(hostname.encode("utf-8"), digest_size=2).digest()
+            return int.from_bytes(digest, "big")
         except Exception:
             # Random fallback
-            import random
             return random.randint(0x1000, 0xFFFF)
 
+    def _encode_message(self, msg: GameMessage) -> bytes:
+        """Encode a message, as MessagePack if packed mode is on."""
+        if self.packed:
+            return encode_message_packed(msg)
+        return encode_message(msg)
+
     def connect(self) -> bool:
         """Initialize the LoRa radio.
 
@@ -111,7 +158,7 @@ class LoRaClient(MeshtasticClient):
         if self._state == ConnectionState.CONNECTED:
             return True
 
-        self._state = ConnectionState.CONNECTING
+        self._set_state(ConnectionState.CONNECTING)
 
         try:
             # Import here to allow running on non-Pi systems for testing
@@ -164,8 +211,10 @@ class LoRaClient(MeshtasticClient):
             self._rfm9x.coding_rate = LORA_CODING_RATE
             self._rfm9x.enable_crc = True
 
+            # Resolve the node ID once; the TX/RX paths read it directly
+            self._node_id = self._get_node_id() & 0xFFFF
             # Set node address (used for filtering if needed)
-            self._rfm9x.node = self._get_node_id() & 0xFF
+            self._rfm9x.node = self._node_id & 0xFF
 
             # Disable address filtering to receive all broadcasts
             self._rfm9x.destination = 0xFF  # Broadcast
@@ -178,16 +227,19 @@ class LoRaClient(MeshtasticClient):
             # Try to initialize OLED display
             self._init_display()
 
-            # Start receive thread
+            self._init_irq()
+
+            # Start the radio thread; the first pass puts the radio in listen mode
+            self._radio_wake.set()
             self._running = True
-            self._receive_thread = threading.Thread(
-                target=self._receive_loop,
+            self._radio_thread = threading.Thread(
+                target=self._radio_loop,
                 daemon=True,
-                name="lora-receive",
+                name="lora-radio",
             )
-            self._receive_thread.start()
+            self._radio_thread.start()
 
-            self._state = ConnectionState.CONNECTED
+            self._set_state(ConnectionState.CONNECTED)
             self._update_display()
 
             return True
@@ -195,21 +247,24 @@ class LoRaClient(MeshtasticClient):
         except ImportError as e:
             logger.error(f"LoRa libraries not available: {e}")
             logger.error("Install with: pip install 'pymeshzork[lora]'")
-            self._state = ConnectionState.DISCONNECTED
+            self._set_state(ConnectionState.DISCONNECTED)
             return False
 
         except Exception as e:
             logger.error(f"Failed to initialize LoRa radio: {e}")
-            self._state = ConnectionState.DISCONNECTED
+            self._set_state(ConnectionState.DISCONNECTED)
             return False
 
     def disconnect(self) -> None:
         """Shutdown the LoRa radio."""
         self._running = False
+        self._radio_wake.set()
 
-        if self._receive_thread:
-            self._receive_thread.join(timeout=2.0)
-            self._receive_thread = None
+        # The radio thread sends anything still queued (e.g. a leave
+        # message) before it exits
+        if self._radio_thread:
+            self._radio_thread.join(timeout=2.0)
+            self._radio_thread = None
 
         if self._rfm9x:
             # Put radio in sleep mode
@@ -219,6 +274,20 @@ class LoRaClient(MeshtasticClient):
                 pass
             self._rfm9x = None
 
+        if self._irq:
+            try:
+                self._irq.close()
+            except Exception:
+                pass
+            self._irq = None
+
+        for btn in self._buttons.values():
+            try:
+                btn.close()
+            except Exception:
+                pass
+        self._buttons.clear()
+
         if self._display:
             try:
                 self._display.fill(0)
@@ -227,83 +296,114 @@ class LoRaClient(MeshtasticClient):
                 pass
             self._display = None
 
-        self._state = ConnectionState.DISCONNECTED
+        self._set_state(ConnectionState.DISCONNECTED)
         logger.info("LoRa radio disconnected")
 
-    def _send_raw(self, data: str) -> None:
-        """Send raw data over LoRa.
+    def _send_raw(self, data: bytes) -> None:
+        """Queue raw data for the LoRa radio thread.
 
         Args:
-            data: JSON-encoded message string.
+            data: JSON or MessagePack encoded message bytes.
 
         Raises:
-            RuntimeError: If radio not connected or transmission fails.
+            RuntimeError: If radio not connected or the payload exceeds the
+                LoRa MTU.
         """
         if not self._rfm9x or self._state != ConnectionState.CONNECTED:
             raise RuntimeError("LoRa radio not connected")
+        if len(data) > LORA_MAX_PAYLOAD:
+            raise RuntimeError(
+                f"Payload of {len(data)} bytes exceeds LoRa MTU ({LORA_MAX_PAYLOAD} bytes)"
+            )
 
-        try:
-            # Add simple frame header: length + player_id prefix
-            # This helps receiving nodes identify message boundaries
-            data_bytes = data.encode('utf-8')
-            frame = struct.pack(">BH", len(data_bytes), self._get_node_id()) + data_bytes
-
-            # Acquire lock before accessing radio (thread safety with receive loop)
-            with self._radio_lock:
-                # Check if channel is clear (simple CSMA)
-                # Wait for channel to be free before transmitting
-                # Note: cad_detected may not be available in all library versions
-                if hasattr(self._rfm9x, 'cad_detected'):
-                    for _ in range(5):
-                        if not self._rfm9x.cad_detected():
-                            break
-                        time.sleep(0.05 + (self._get_node_id() % 50) / 1000)  # Random backoff
-
-                # Transmit
-                self._rfm9x.send(frame)
-
-            logger.debug(f"LoRa TX: {len(frame)} bytes")
-            self._update_display(tx=True)
+        # Add simple frame header: length + player_id prefix
+        # This helps receiving nodes identify message boundaries
+        self._tx_queue.put(_FRAME_HEADER.pack(len(data), self._node_id) + data)
+        self._radio_wake.set()
 
-        except Exception as e:
-            logger.error(f"LoRa TX error: {e}")
-            raise
+    def _drain_tx_queue(self) -> None:
+        """Transmit every queued frame, in order. Runs on the radio thread."""
+        while True:
+            try:
+                frame = self._tx_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self._transmit(frame)
+            except Exception as e:
+                logger.error(f"LoRa TX error: {e}")
+
+    def _transmit(self, frame: bytes) -> None:
+        """Wait for a clear channel and transmit one frame."""
+        if not self._rfm9x:
+            raise RuntimeError("LoRa radio not connected")
+
+        # Check if channel is clear (simple CSMA)
+        # Wait for channel to be free before transmitting
+        # Note: cad_detected may not be available in all library versions
+        if hasattr(self._rfm9x, 'cad_detected'):
+            for attempt in range(CSMA_ATTEMPTS):
+                if not self._rfm9x.cad_detected():
+                    break
+                # Binary exponential backoff
+                time.sleep(self._rng.uniform(0, CSMA_SLOT * (1 << attempt)))
+
+        # Transmit, then go straight back to listening so an interrupt-driven
+        # radio loop doesn't miss packets
+        self._rfm9x.send(frame, keep_listening=True)
 
-    def _receive_loop(self) -> None:
-        """Background thread to receive LoRa packets."""
-        logger.info("LoRa receive loop started")
+        # Lazy %-formatting: this runs per packet, usually with debug off
+        logger.debug("LoRa TX: %d bytes", len(frame))
+        self._update_display(tx=True)
 
-        while self._running:
+    def _radio_loop(self) -> None:
+        """Background thread that owns the radio: sends queued frames, receives packets."""
+        logger.info("LoRa radio loop started")
+        own_id = self._node_id
+
+        while True:
             try:
-                # Check for incoming packet with timeout
-                # Acquire lock briefly for thread safety with send
-                with self._radio_lock:
-                    packet = self._rfm9x.receive(timeout=RECEIVE_TIMEOUT)
-                    last_rssi = self._rfm9x.last_rssi if packet else None
+                if self._irq is not None:
+                    # Sleep until the radio signals a packet or a frame is queued
+                    self._radio_wake.wait(IRQ_WATCHDOG)
+                    self._radio_wake.clear()
+                    timeout = 0.0
+                else:
+                    timeout = RECEIVE_TIMEOUT
+
+                self._drain_tx_queue()
+                if not self._running:
+                    break
+
+                # Check for incoming packet
+                packet = self._rfm9x.receive(timeout=timeout)
+                last_rssi = self._rfm9x.last_rssi if packet else None
 
                 if packet is None:
                     continue
 
                 # Parse frame header
-                if len(packet) < 3:
+                if len(packet) < _FRAME_HEADER.size:
                     continue
 
-                length, sender_id = struct.unpack(">BH", packet[:3])
-                data = packet[3:3+length]
+                length, sender_id = _FRAME_HEADER.unpack_from(packet)
 
-                # Skip our own messages
-                if sender_id == self._get_node_id():
+                # Skip our own messages before touching the payload
+                if sender_id == own_id:
                     continue
 
+                # A view, so the payload isn't copied before decoding
+                start = _FRAME_HEADER.size
+                data = memoryview(packet)[start:start + length]
+
                 # Decode message
                 try:
-                    json_str = data.decode('utf-8')
-                    message = decode_message(json_str)
+                    message = decode_message(data)
 
                     if message:
                         logger.debug(
-                            f"LoRa RX: {len(packet)} bytes from {sender_id:04x}, "
-                            f"type={message.type.value}, RSSI={last_rssi}dBm"
+                            "LoRa RX: %d bytes from %04x, type=%s, RSSI=%sdBm",
+                            len(packet), sender_id, message.type.value, last_rssi,
                         )
 
                         self._update_display(rx=True, rssi=last_rssi)
@@ -315,7 +415,7 @@ class LoRaClient(MeshtasticClient):
                             except Exception as e:
                                 logger.error(f"Message callback error: {e}")
 
-                except (UnicodeDecodeError, ValueError) as e:
+                except (ValueError, KeyError, TypeError) as e:
                     logger.warning(f"Failed to decode LoRa packet: {e}")
 
             except Exception as e:
@@ -323,7 +423,20 @@ class LoRaClient(MeshtasticClient):
                     logger.error(f"LoRa receive error: {e}")
                     time.sleep(0.5)
 
-        logger.info("LoRa receive loop stopped")
+        logger.info("LoRa radio loop stopped")
+
+    def _init_irq(self) -> None:
+        """Wake the radio loop on the radio's DIO0 interrupt, if possible."""
+        try:
+            from gpiozero import DigitalInputDevice
+
+            self._irq = DigitalInputDevice(IRQ_PIN, pull_up=None, active_state=True)
+            self._irq.when_activated = self._radio_wake.set
+            logger.info(f"LoRa receive is interrupt driven (GPIO{IRQ_PIN})")
+
+        except Exception as e:
+            logger.info(f"Radio interrupt not available, polling instead: {e}")
+            self._irq = None
 
     # =========================================================================
     # OLED Display
@@ -382,6 +495,17 @@ class LoRaClient(MeshtasticClient):
             self._display.fill(0)
             self._display.show()
 
+            # Reuse one image buffer and load the fonts once, rather than
+            # on every TX/RX redraw
+            self._image = Image.new("1", (128, 32))
+            self._draw = ImageDraw.Draw(self._image)
+            try:
+                self._font = ImageFont.truetype(DISPLAY_FONT, 10)
+                self._font_small = ImageFont.truetype(DISPLAY_FONT, 8)
+            except Exception:
+                self._font = ImageFont.load_default()
+                self._font_small = self._font
+
             self._display_enabled = True
             logger.info("OLED display initialized")
 
@@ -399,20 +523,26 @@ class LoRaClient(MeshtasticClient):
         if not self._display_enabled or not self._display:
             return
 
+        # TX/RX flashes during bursts are invisible anyway; skip the redraw
+        now = time.monotonic()
+        if (tx or rx) and now - self._last_display_update < DISPLAY_MIN_INTERVAL:
+            return
+        self._last_display_update = now
+
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            self._draw_display(tx, rx, rssi)
+        except Exception as e:
+            logger.debug(f"Display update error: {e}")
 
-            # Create image buffer
-            image = Image.new("1", (128, 32))
-            draw = ImageDraw.Draw(image)
+    def _draw_display(self, tx: bool, rx: bool, rssi: int | None) -> None:
+        """Redraw the shared image buffer and push it to the OLED."""
+        with self._display_lock:
+            draw = self._draw
+            font = self._font
+            font_small = self._font_small
 
-            # Use default font
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10)
-                font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 8)
-            except Exception:
-                font = ImageFont.load_default()
-                font_small = font
+            # Clear the buffer
+            draw.rectangle((0, 0, 128, 32), fill=0)
 
             # Line 1: Game title and player name
             draw.text((0, 0), f"ZORK: {self.player_name[:10]}", font=font, fill=255)
@@ -437,12 +567,9 @@ class LoRaClient(MeshtasticClient):
                 draw.text((70, 22), room_text, font=font_small, fill=255)
 
             # Display the image
-            self._display.image(image)
+            self._display.image(self._image)
             self._display.show()
 
-        except Exception as e:
-            logger.debug(f"Display update error: {e}")
-
     def set_room(self, room_id: str) -> None:
         """Update current room for display."""
         super().set_room(room_id)
@@ -466,52 +593,33 @@ class LoRaClient(MeshtasticClient):
             on_button_c: Callback for button C (GPIO12).
         """
         try:
-            import board
-            import digitalio
+            from gpiozero import Button
 
             buttons = [
-                (board.D5, "A", on_button_a),
-                (board.D6, "B", on_button_b),
-                (board.D12, "C", on_button_c),
+                (5, "A", on_button_a),
+                (6, "B", on_button_b),
+                (12, "C", on_button_c),
             ]
 
             for pin, name, callback in buttons:
                 if callback:
-                    btn = digitalio.DigitalInOut(pin)
-                    btn.direction = digitalio.Direction.INPUT
-                    btn.pull = digitalio.Pull.UP
-                    self._button_callbacks[name] = (btn, callback)
-
-            # Start button polling thread if we have callbacks
-            if self._button_callbacks:
-                thread = threading.Thread(
-                    target=self._button_poll_loop,
-                    daemon=True,
-                    name="button-poll",
-                )
-                thread.start()
+                    # Edge-triggered: nothing runs until the button is pressed
+                    btn = Button(pin, pull_up=True, bounce_time=0.05)
+                    btn.when_pressed = self._button_handler(name, callback)
+                    self._buttons[name] = btn
 
         except Exception as e:
             logger.warning(f"Button setup failed: {e}")
 
-    def _button_poll_loop(self) -> None:
-        """Poll buttons and trigger callbacks."""
-        button_state = {name: True for name in self._button_callbacks}
-
-        while self._running:
-            for name, (btn, callback) in self._button_callbacks.items():
-                current = btn.value
-
-                # Detect button press (active low)
-                if button_state[name] and not current:
-                    try:
-                        callback()
-                    except Exception as e:
-                        logger.error(f"Button {name} callback error: {e}")
-
-                button_state[name] = current
-
-            time.sleep(0.05)  # 50ms polling
+    @staticmethod
+    def _button_handler(name: str, callback: Callable[[], None]) -> Callable[[], None]:
+        """Wrap a button callback so errors are logged, not raised in the GPIO thread."""
+        def handler() -> None:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Button {name} callback error: {e}")
+        return handler
 
 
 def create_lora_client(
@@ -3,14 +3,15 @@
 Connects to Meshtastic network via MQTT broker (local Mosquitto or public).
 """
 
-import json
 import logging
+import socket
+import ssl
 import threading
 import time
 from typing import Any
 
 from pymeshzork.meshtastic.client import MeshtasticClient, ConnectionState
-from pymeshzork.meshtastic.protocol import PROTOCOL_VERSION
+from pymeshzork.meshtastic.protocol import PROTOCOL_VERSION, encode_json
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,9 @@ class MQTTClient(MeshtasticClient):
         username: str | None = None,
         password: str | None = None,
         use_tls: bool = False,
+        tcp_nodelay: bool = True,
+        socket_sndbuf: int | None = None,
+        socket_rcvbuf: int | None = None,
     ):
         """Initialize MQTT client.
 
@@ -59,6 +63,10 @@ class MQTTClient(MeshtasticClient):
             username: Optional MQTT username.
             password: Optional MQTT password.
             use_tls: Whether to use TLS encryption.
+            tcp_nodelay: Disable Nagle's algorithm so small game messages
+                aren't held back waiting to be coalesced.
+            socket_sndbuf: Optional socket send buffer size in bytes.
+            socket_rcvbuf: Optional socket receive buffer size in bytes.
         """
         super().__init__(player_name, channel)
 
@@ -67,11 +75,30 @@ class MQTTClient(MeshtasticClient):
         self.username = username
         self.password = password
         self.use_tls = use_tls
+        self.tcp_nodelay = tcp_nodelay
+        self.socket_sndbuf = socket_sndbuf
+        self.socket_rcvbuf = socket_rcvbuf
 
         # paho-mqtt client (lazy import)
         self._mqtt_client: Any = None
         self._mqtt_connected = threading.Event()
 
+        # Subscriptions, resubscribed on every (re)connect
+        self._topics = (
+            f"{self.TOPIC_PREFIX}/{self.channel}/+",  # All message types
+            f"{self.TOPIC_PRESENCE}/{self.channel}",
+            f"{self.TOPIC_CHAT}/{self.channel}",
+        )
+        # TLS context, created on first use so the CA bundle is parsed once
+        self._ssl_context: ssl.SSLContext | None = None
+
+        # Fields shared by every chat/presence payload, built once
+        self._identity = {
+            "v": PROTOCOL_VERSION,
+            "p": self.player_id,
+            "n": self.player_name[:16],
+        }
+
     def _ensure_paho(self) -> bool:
         """Ensure paho-mqtt is available."""
         try:
@@ -83,13 +110,9 @@ class MQTTClient(MeshtasticClient):
             )
             return False
 
-    def _get_topics(self) -> list[str]:
-        """Get list of topics to subscribe to."""
-        return [
-            f"{self.TOPIC_PREFIX}/{self.channel}/+",  # All message types
-            f"{self.TOPIC_PRESENCE}/{self.channel}",
-            f"{self.TOPIC_CHAT}/{self.channel}",
-        ]
+    def _get_topics(self) -> tuple[str, ...]:
+        """Get the topics to subscribe to."""
+        return self._topics
 
     def connect(self) -> bool:
         """Connect to the MQTT broker."""
@@ -112,6 +135,7 @@ class MQTTClient(MeshtasticClient):
             self._mqtt_client.on_connect = self._on_connect
             self._mqtt_client.on_disconnect = self._on_disconnect
             self._mqtt_client.on_message = self._on_message
+            self._mqtt_client.on_socket_open = self._on_socket_open
 
             # Authentication
             if self.username and self.password:
@@ -119,7 +143,12 @@ class MQTTClient(MeshtasticClient):
 
             # TLS
             if self.use_tls:
-                self._mqtt_client.tls_set()
+                if self._ssl_context is None:
+                    self._ssl_context = ssl.create_default_context()
+                self._mqtt_client.tls_set_context(self._ssl_context)
+
+            # Let paho's network thread handle reconnects with bounded backoff
+            self._mqtt_client.reconnect_delay_set(min_delay=1, max_delay=30)
 
             # Connect
             logger.info(f"Connecting to MQTT broker at {self.broker}:{self.port}")
@@ -131,15 +160,14 @@ class MQTTClient(MeshtasticClient):
             # Wait for connection with timeout
             if not self._mqtt_connected.wait(timeout=10):
                 logger.error("Connection timeout")
+                # Don't leave the network thread running for a failed client
+                self._mqtt_client.loop_stop()
                 self._set_state(ConnectionState.ERROR)
                 return False
 
-            # Start heartbeat
+            # Start heartbeat (_on_connect has already flushed the queue)
             self._start_heartbeat()
 
-            # Flush any queued messages
-            self._flush_queue()
-
             return True
 
         except Exception as e:
@@ -165,7 +193,7 @@ class MQTTClient(MeshtasticClient):
         self._mqtt_connected.clear()
         self._set_state(ConnectionState.DISCONNECTED)
 
-    def _send_raw(self, data: str) -> None:
+    def _send_raw(self, data: bytes) -> None:
         """Send raw data via MQTT."""
         if not self._mqtt_client or self.state != ConnectionState.CONNECTED:
             raise ConnectionError("Not connected")
@@ -201,6 +229,19 @@ class MQTTClient(MeshtasticClient):
             logger.error(f"Connection failed with code: {reason_code}")
             self._set_state(ConnectionState.ERROR)
 
+    def _on_socket_open(self, client: Any, userdata: Any, sock: Any) -> None:
+        """Apply socket options to each new broker connection."""
+        try:
+            if self.tcp_nodelay:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.socket_sndbuf:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_sndbuf)
+            if self.socket_rcvbuf:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_rcvbuf)
+        except (AttributeError, OSError) as e:
+            # e.g. websocket transports don't expose a plain TCP socket
+            logger.debug(f"Could not set socket options: {e}")
+
     def _on_disconnect(
         self,
         client: Any,
@@ -225,10 +266,10 @@ class MQTTClient(MeshtasticClient):
     ) -> None:
         """Handle incoming MQTT message."""
         try:
-            payload = message.payload.decode("utf-8")
-            self._handle_incoming(payload)
+            # The decoder takes bytes directly
+            self._handle_incoming(message.payload)
         except Exception as e:
-            logger.debug(f"Failed to process message: {e}")
+            logger.debug("Failed to process message: %s", e)
 
     def send_chat(self, message: str, is_team: bool = False) -> bool:
         """Send a chat message with dedicated topic."""
@@ -237,14 +278,13 @@ class MQTTClient(MeshtasticClient):
         # Also publish to dedicated chat topic for chat-only subscribers
         if self._mqtt_client and self.state == ConnectionState.CONNECTED:
             chat_data = {
-                "v": PROTOCOL_VERSION,
-                "p": self.player_id,
-                "n": self.player_name[:16],
+                **self._identity,
                 "m": message[:128],
                 "t": "team" if is_team else "room",
             }
             topic = f"{self.TOPIC_CHAT}/{self.channel}"
-            self._mqtt_client.publish(topic, json.dumps(chat_data), qos=1)
+            # QoS 0: the game-topic copy above is the reliable one
+            self._mqtt_client.publish(topic, encode_json(chat_data), qos=0)
 
         return result
 
@@ -252,9 +292,7 @@ class MQTTClient(MeshtasticClient):
         """Publish presence to dedicated presence topic."""
         if self._mqtt_client and self.state == ConnectionState.CONNECTED:
             presence_data = {
-                "v": PROTOCOL_VERSION,
-                "p": self.player_id,
-                "n": self.player_name[:16],
+                **self._identity,
                 "r": self._current_room,
                 "online": online,
                 "ts": int(time.time()),
@@ -262,7 +300,7 @@ class MQTTClient(MeshtasticClient):
             topic = f"{self.TOPIC_PRESENCE}/{self.channel}"
             self._mqtt_client.publish(
                 topic,
-                json.dumps(presence_data),
-                qos=1,
+                encode_json(presence_data),
+                qos=0,  # Superseded by the next update; no PUBACK needed
                 retain=True,  # Retain last presence
             )
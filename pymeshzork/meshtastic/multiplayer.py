@@ -11,7 +11,12 @@ Supports multiple backends:
 - LoRa: For Raspberry Pi with Adafruit Radio Bonnet (direct RF)
 """
 
+import functools
+import importlib
+import inspect
 import logging
+import threading
+from collections import deque
 from enum import Enum
 from typing import TYPE_CHECKING, Callable
 
@@ -19,7 +24,14 @@ from pymeshzork.config import get_config
 from pymeshzork.meshtastic.client import MeshtasticClient, ConnectionState
 from pymeshzork.meshtastic.mqtt_client import MQTTClient
 from pymeshzork.meshtastic.presence import PresenceManager, PlayerInfo
-from pymeshzork.meshtastic.protocol import MessageType, GameMessage
+from pymeshzork.meshtastic.protocol import (
+    MessageType,
+    GameMessage,
+    ROOM_IDS,
+    create_join_message,
+    create_move_message,
+    create_action_message,
+)
 from pymeshzork.meshtastic.oled_display import get_display
 
 if TYPE_CHECKING:
@@ -27,6 +39,78 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Outgoing announcements are handed to the client in batches: at most this
+# many messages, held for at most this long
+OUTBOX_MAX_MESSAGES = 16
+OUTBOX_MAX_DELAY = 0.02  # seconds
+
+# Remote events held for the game loop; the oldest are dropped past this
+MAX_PENDING_EVENTS = 256
+
+# Kinds of queued remote event
+_EVENT_JOIN = "join"
+_EVENT_LEAVE = "leave"
+_EVENT_MOVE = "move"
+_EVENT_ACTION = "action"
+_EVENT_CHAT = "chat"
+
+# Kinds where only a player's most recent line in a drain is worth showing
+_LATEST_ONLY_EVENTS = frozenset((_EVENT_JOIN, _EVENT_LEAVE, _EVENT_MOVE))
+
+# Templates for remote-event lines, %-formatted per received message
+_MSG_ENTERED = "\n[%s has entered the game]"
+_MSG_EXITED = "\n[%s has left the game]"
+_MSG_ARRIVED = "\n%s has arrived."
+_MSG_LEFT = "\n%s has left."
+_MSG_ACTION_OBJ = "\n%s %ss the %s."
+_MSG_ACTION = "\n%s %ss."
+_MSG_CHAT = "\n%s says: \"%s\""
+_MSG_TEAM = "\n[Team] %s: %s"
+
+# Bursts of presence events within this window share one OLED refresh
+DISPLAY_REFRESH_DELAY = 0.05  # seconds
+
+
+# Optional client classes by module name, or the ImportError that loading
+# them raised, so a retried connect() doesn't repeat a failed import
+_client_classes: dict[str, type[MeshtasticClient] | ImportError] = {}
+
+
+def _load_client_class(module: str, name: str) -> type[MeshtasticClient]:
+    """Import an optional client class from this package, once."""
+    cls = _client_classes.get(module)
+    if cls is None:
+        try:
+            cls = getattr(importlib.import_module(f"{__package__}.{module}"), name)
+        except ImportError as e:
+            cls = e
+        _client_classes[module] = cls
+    if isinstance(cls, ImportError):
+        raise cls
+    return cls
+
+
+def _noop(*args) -> None:
+    """Stand-in for display and room updates with nothing attached."""
+
+
+def _detect_set_room(client: MeshtasticClient) -> Callable[[str, str], None]:
+    """Return a room-update function matching the client's set_room().
+
+    Some clients take a display name for the room as well as its ID; the
+    signature is checked once here rather than on every room change.
+    """
+    set_room = getattr(client, "set_room", None)
+    if set_room is None:
+        return _noop
+    try:
+        takes_name = len(inspect.signature(set_room).parameters) >= 2
+    except (TypeError, ValueError):
+        takes_name = False
+    if takes_name:
+        return set_room
+    return lambda room_id, room_name: set_room(room_id)
+
 
 class MultiplayerBackend(Enum):
     """Available multiplayer backends."""
@@ -43,6 +127,37 @@ class MultiplayerManager:
     Supports multiple backends (MQTT, LoRa).
     """
 
+    __slots__ = (
+        "player_name",
+        "mqtt_config",
+        "lora_config",
+        "serial_config",
+        "_backend",
+        "_client",
+        "_connected",
+        "_set_room_fn",
+        "_enabled_in_config",
+        "_presence",
+        "_game",
+        "_callbacks",
+        "_pending_events",
+        "_outbox",
+        "_outbox_lock",
+        "_outbox_timer",
+        "_room_index",
+        "_player_room",
+        "_room_lock",
+        "_last_sent_names",
+        "_players_here",
+        "_current_room",
+        "_display_dirty",
+        "_display_flush_timer",
+        "_display",
+        "_display_add_message",
+        "_display_set_players",
+        "_display_update_player",
+    )
+
     def __init__(
         self,
         player_name: str | None = None,
@@ -75,21 +190,58 @@ class MultiplayerManager:
             self._backend = backend
 
         self._client: MeshtasticClient | None = None
+        # Mirrors the client's state via its state callback, so the game
+        # loop's is_connected checks don't go through the client each time
+        self._connected = False
+        # Bound at connect time to match the client's set_room() signature
+        self._set_room_fn: Callable[[str, str], None] = _noop
+        # Config-based backends can't become enabled without a restart
+        self._enabled_in_config = self._check_config_enabled()
         self._presence: PresenceManager | None = None
         self._game: "Game | None" = None
 
-        # Message callbacks for the game to register
-        self._on_player_join: list[Callable[[PlayerInfo], None]] = []
-        self._on_player_leave: list[Callable[[PlayerInfo], None]] = []
-        self._on_player_move: list[Callable[[PlayerInfo, str, str], None]] = []
-        self._on_player_action: list[Callable[[PlayerInfo, str, str | None], None]] = []
-        self._on_chat: list[Callable[[PlayerInfo, str, bool], None]] = []
-
-        # Pending messages to display
-        self._pending_messages: list[str] = []
+        # Message callbacks for the game to register, by event kind, run when
+        # pending events are drained. Tuples are replaced on registration, so
+        # they can be read from any thread without a lock
+        self._callbacks: dict[str, tuple[Callable[..., None], ...]] = {
+            _EVENT_JOIN: (),
+            _EVENT_LEAVE: (),
+            _EVENT_MOVE: (),
+            _EVENT_ACTION: (),
+            _EVENT_CHAT: (),
+        }
+
+        # Remote events as (kind, line to display, callback args), drained
+        # by the game loop through get_pending_messages()
+        self._pending_events: deque[tuple[str, str | None, tuple]] = deque(
+            maxlen=MAX_PENDING_EVENTS
+        )
 
-        # OLED display reference
+        # Outgoing messages waiting to go to the client as one batch
+        self._outbox: list[GameMessage] = []
+        self._outbox_lock = threading.Lock()
+        self._outbox_timer: threading.Timer | None = None
+
+        # Remote players by room, kept in step with presence events so the
+        # OLED player list doesn't need a full presence scan per event
+        self._room_index: dict[str, dict[str, str]] = {}  # room -> {player_id: name}
+        self._player_room: dict[str, str] = {}  # player_id -> room
+        self._room_lock = threading.Lock()
+        self._last_sent_names: list[str] | None = None
+        # "X and Y are here." text per room, dropped when the room changes
+        self._players_here: dict[str, str | None] = {}
+
+        # The local player's room, kept by set_game()/update_room() so the
+        # receive path doesn't walk into the game state per packet
+        self._current_room: str | None = None
+
+        # Player-list refreshes are coalesced onto a short one-shot timer
+        self._display_dirty = False
+        self._display_flush_timer: threading.Timer | None = None
+
+        # OLED display reference and its bound methods (no-ops when absent)
         self._display = None
+        self._bind_display(None)
 
     @property
     def backend(self) -> MultiplayerBackend:
@@ -103,20 +255,26 @@ class MultiplayerManager:
             # Native uses meshtasticd - check if it's running
             from pymeshzork.meshtastic.native_client import check_meshtasticd_running
             return check_meshtasticd_running()
-        elif self._backend == MultiplayerBackend.SERIAL:
+        return self._enabled_in_config
+
+    def _check_config_enabled(self) -> bool:
+        """Check whether the config enables the selected backend."""
+        if self._backend == MultiplayerBackend.SERIAL:
             return self.serial_config.enabled
         elif self._backend == MultiplayerBackend.LORA:
             return self.lora_config.enabled
-        else:
+        elif self._backend == MultiplayerBackend.MQTT:
             return self.mqtt_config.enabled and self.mqtt_config.is_configured()
+        return False
 
     @property
     def is_connected(self) -> bool:
         """Check if currently connected to multiplayer."""
-        return (
-            self._client is not None
-            and self._client.state == ConnectionState.CONNECTED
-        )
+        return self._connected
+
+    def _on_client_state(self, state: ConnectionState) -> None:
+        """Track the client's connection state."""
+        self._connected = state == ConnectionState.CONNECTED
 
     @property
     def player_id(self) -> str | None:
@@ -154,14 +312,11 @@ class MultiplayerManager:
             self._presence = PresenceManager(self._client.player_id)
             self._presence.start()
 
-            # Wire up callbacks
-            self._presence.on_join(self._handle_player_join)
-            self._presence.on_leave(self._handle_player_leave)
-            self._presence.on_move(self._handle_player_move)
-            self._presence.on_action(self._handle_player_action)
-            self._presence.on_chat(self._handle_chat)
+            self._wire_presence(self._presence)
 
             self._client.on_message(self._presence.handle_message)
+            self._client.on_state_change(self._on_client_state)
+            self._set_room_fn = _detect_set_room(self._client)
 
             # Connect
             if self._client.connect():
@@ -169,9 +324,9 @@ class MultiplayerManager:
                 logger.info(f"Connected to multiplayer ({backend_name}) as {self.player_name}")
 
                 # Initialize OLED display
-                self._display = get_display()
+                self._bind_display(get_display())
+                self._display_update_player(self.player_name)
                 if self._display:
-                    self._display.update_player(self.player_name)
                     self._display.set_connected(True, backend_name)
 
                 return True
@@ -193,12 +348,15 @@ class MultiplayerManager:
             password=self.mqtt_config.password or None,
             use_tls=self.mqtt_config.use_tls,
             channel=self.mqtt_config.channel,
+            tcp_nodelay=True,
+            socket_sndbuf=65536,
+            socket_rcvbuf=65536,
         )
 
     def _create_lora_client(self) -> "MeshtasticClient | None":
         """Create a LoRa client."""
         try:
-            from pymeshzork.meshtastic.lora_client import LoRaClient
+            LoRaClient = _load_client_class("lora_client", "LoRaClient")
             return LoRaClient(
                 player_name=self.player_name,
                 frequency=self.lora_config.frequency,
@@ -212,7 +370,7 @@ class MultiplayerManager:
     def _create_serial_client(self) -> "MeshtasticClient | None":
         """Create a serial client for Meshtastic devices."""
         try:
-            from pymeshzork.meshtastic.serial_client import SerialClient
+            SerialClient = _load_client_class("serial_client", "SerialClient")
             return SerialClient(
                 player_name=self.player_name,
                 port=self.serial_config.port or None,  # Empty string -> auto-detect
@@ -225,7 +383,7 @@ class MultiplayerManager:
     def _create_native_client(self) -> "MeshtasticClient | None":
         """Create a native client for meshtasticd (Meshtastic on Radio Bonnet)."""
         try:
-            from pymeshzork.meshtastic.native_client import NativeClient
+            NativeClient = _load_client_class("native_client", "NativeClient")
             return NativeClient(
                 player_name=self.player_name,
             )
@@ -236,22 +394,39 @@ class MultiplayerManager:
 
     def disconnect(self) -> None:
         """Disconnect from multiplayer server."""
+        self.flush()
+
         if self._presence:
             self._presence.stop()
             self._presence = None
 
+        # Cleared first so the send_* fast path never sees a connected flag
+        # without a client
+        self._connected = False
         if self._client:
             self._client.disconnect()
             self._client = None
+        self._set_room_fn = _noop
+
+        with self._room_lock:
+            self._room_index.clear()
+            self._player_room.clear()
+            self._players_here.clear()
+            self._last_sent_names = None
+            timer, self._display_flush_timer = self._display_flush_timer, None
+            self._display_dirty = False
+        if timer is not None:
+            timer.cancel()
 
         # Update OLED display
         if self._display:
             self._display.set_connected(False)
-            self._display = None
+            self._bind_display(None)
 
     def set_game(self, game: "Game") -> None:
         """Set the game instance for integration."""
         self._game = game
+        self._current_room = game.state.current_room
 
     # =========================================================================
     # Outgoing messages (game -> network)
@@ -259,24 +434,80 @@ class MultiplayerManager:
 
     def send_join(self, room_id: str) -> None:
         """Announce joining the game."""
-        if self._client and self.is_connected:
-            self._client.send_join(room_id)
+        if not self._connected:
+            return
+        client = self._client
+        client.current_room = room_id
+        self._enqueue(create_join_message(client.player_id, client.player_name, room_id))
 
     def send_move(self, from_room: str, to_room: str) -> None:
         """Announce moving to a new room."""
-        if self._client and self.is_connected:
-            self._client.send_move(from_room, to_room)
+        if not self._connected:
+            return
+        client = self._client
+        client.current_room = to_room
+        if not self._coalesce_move(to_room):
+            self._enqueue(
+                create_move_message(client.player_id, from_room, to_room, client.player_name)
+            )
 
     def send_action(self, verb: str, obj_id: str | None = None) -> None:
         """Announce performing an action."""
-        if self._client and self.is_connected:
-            room_id = self._game.state.current_room if self._game else None
-            self._client.send_action(verb, obj_id, room_id)
+        if not self._connected:
+            return
+        client = self._client
+        room_id = self._current_room or client.current_room
+        self._enqueue(create_action_message(client.player_id, verb, obj_id, room_id))
 
     def send_chat(self, message: str, is_team: bool = False) -> None:
         """Send a chat message."""
-        if self._client and self.is_connected:
-            self._client.send_chat(message, is_team)
+        if not self._connected:
+            return
+        # Chat goes through the client (MQTT also publishes it to the chat
+        # topic), after anything announced before it
+        self.flush()
+        self._client.send_chat(message, is_team)
+
+    def flush(self) -> None:
+        """Send any outgoing messages still waiting in the outbox."""
+        with self._outbox_lock:
+            batch, self._outbox = self._outbox, []
+            timer, self._outbox_timer = self._outbox_timer, None
+        if timer is not None:
+            timer.cancel()
+        if batch and self._client:
+            self._client.send_batch(batch)
+
+    def _coalesce_move(self, to_room: str) -> bool:
+        """Fold a move into a join or move still waiting at the end of the outbox.
+
+        A quick A->B->C walk goes out as a single A->C move (or a join in C),
+        keeping the original from-room. Only the newest outbox entry is
+        rewritten so ordering with other announcements is preserved.
+
+        Returns:
+            True if the move was folded into a pending message.
+        """
+        with self._outbox_lock:
+            if not self._outbox:
+                return False
+            last = self._outbox[-1]
+            if last.type not in (MessageType.PLAYER_JOIN, MessageType.PLAYER_MOVE):
+                return False
+            last.data["r"] = ROOM_IDS.get(to_room, 0)
+            return True
+
+    def _enqueue(self, msg: GameMessage) -> None:
+        """Add a message to the outbox, flushing once it is full or has waited long enough."""
+        with self._outbox_lock:
+            self._outbox.append(msg)
+            full = len(self._outbox) >= OUTBOX_MAX_MESSAGES
+            if not full and self._outbox_timer is None:
+                self._outbox_timer = threading.Timer(OUTBOX_MAX_DELAY, self.flush)
+                self._outbox_timer.daemon = True
+                self._outbox_timer.start()
+        if full:
+            self.flush()
 
     def update_room(self, room_id: str, room_name: str = "") -> None:
         """Update the current room context.
@@ -285,20 +516,79 @@ class MultiplayerManager:
             room_id: Room ID.
             room_name: Human-readable room name for display.
         """
-        if self._client:
-            # Check if client supports room_name parameter
-            if hasattr(self._client, 'set_room'):
-                try:
-                    self._client.set_room(room_id, room_name)
-                except TypeError:
-                    self._client.set_room(room_id)
+        self._set_room_fn(room_id, room_name)
 
         # Update OLED display with room and players
-        if self._display:
-            self._display.update_player(self.player_name, room_id, room_name)
-            players = self.get_players_in_room(room_id)
-            player_names = [p.name for p in players]
-            self._display.set_players_in_room(player_names)
+        self._display_update_player(self.player_name, room_id, room_name)
+        self._current_room = room_id
+        self._mark_display_dirty()
+
+    def _bind_display(self, display) -> None:
+        """Set the OLED display and cache the methods the handlers call."""
+        self._display = display
+        if display:
+            self._display_add_message = display.add_message
+            self._display_set_players = display.set_players_in_room
+            self._display_update_player = display.update_player
+        else:
+            self._display_add_message = _noop
+            self._display_set_players = _noop
+            self._display_update_player = _noop
+
+    def _wire_presence(self, presence: PresenceManager) -> None:
+        """Subscribe to every presence event that changes who is where."""
+        presence.on_join(self._handle_player_join)
+        presence.on_leave(self._handle_player_leave)
+        presence.on_move(self._handle_player_move)
+        presence.on_action(self._handle_player_action)
+        presence.on_chat(self._handle_chat)
+        presence.on_room_change(self._handle_player_room_change)
+
+    def _index_player(self, player: PlayerInfo, room_id: str | None) -> None:
+        """Move a player to a room in the room index (None removes them)."""
+        with self._room_lock:
+            old_room = self._player_room.pop(player.player_id, None)
+            if old_room is not None:
+                self._players_here.pop(old_room, None)
+                occupants = self._room_index.get(old_room)
+                if occupants is not None:
+                    occupants.pop(player.player_id, None)
+                    if not occupants:
+                        del self._room_index[old_room]
+            if room_id is not None:
+                self._players_here.pop(room_id, None)
+                self._player_room[player.player_id] = room_id
+                self._room_index.setdefault(room_id, {})[player.player_id] = player.name
+
+    def _mark_display_dirty(self) -> None:
+        """Schedule an OLED player-list refresh, coalescing bursts of events."""
+        if not self._display:
+            return
+        with self._room_lock:
+            self._display_dirty = True
+            if self._display_flush_timer is None:
+                self._display_flush_timer = threading.Timer(
+                    DISPLAY_REFRESH_DELAY, self._flush_display
+                )
+                self._display_flush_timer.daemon = True
+                self._display_flush_timer.start()
+
+    def _flush_display(self) -> None:
+        """Push the current room's player list to the OLED if it changed."""
+        room_id = self._current_room
+
+        with self._room_lock:
+            self._display_flush_timer = None
+            if not self._display_dirty:
+                return
+            self._display_dirty = False
+            if not self._display or room_id is None:
+                return
+            names = sorted(self._room_index.get(room_id, {}).values())
+            if names == self._last_sent_names:
+                return
+            self._last_sent_names = names
+        self._display_set_players(names)
 
     # =========================================================================
     # Incoming message handlers
@@ -306,120 +596,141 @@ class MultiplayerManager:
 
     def _handle_player_join(self, player: PlayerInfo) -> None:
         """Handle remote player joining."""
-        msg = f"\n[{player.name} has entered the game]"
-        self._pending_messages.append(msg)
+        self._index_player(player, player.room_id)
 
         # Update OLED display
-        if self._display:
-            self._display.add_message(f"{player.name} joined")
-            # Update player list if in same room
-            if self._game:
-                current_room = self._game.state.current_room
-                players = self.get_players_in_room(current_room)
-                player_names = [p.name for p in players]
-                self._display.set_players_in_room(player_names)
-
-        for callback in self._on_player_join:
-            try:
-                callback(player)
-            except Exception:
-                pass
+        self._display_add_message(f"{player.name} joined")
+        self._mark_display_dirty()
+
+        self._add_event(_EVENT_JOIN, _MSG_ENTERED % player.name, (player,))
 
     def _handle_player_leave(self, player: PlayerInfo) -> None:
         """Handle remote player leaving."""
-        msg = f"\n[{player.name} has left the game]"
-        self._pending_messages.append(msg)
+        self._index_player(player, None)
 
         # Update OLED display
-        if self._display:
-            self._display.add_message(f"{player.name} left")
-            # Update player list if in same room
-            if self._game:
-                current_room = self._game.state.current_room
-                players = self.get_players_in_room(current_room)
-                player_names = [p.name for p in players]
-                self._display.set_players_in_room(player_names)
-
-        for callback in self._on_player_leave:
-            try:
-                callback(player)
-            except Exception:
-                pass
+        self._display_add_message(f"{player.name} left")
+        self._mark_display_dirty()
+
+        self._add_event(_EVENT_LEAVE, _MSG_EXITED % player.name, (player,))
 
     def _handle_player_move(self, player: PlayerInfo, from_room: str, to_room: str) -> None:
         """Handle remote player moving."""
-        if self._game:
-            current_room = self._game.state.current_room
+        self._index_player(player, to_room)
 
+        msg = None
+        current_room = self._current_room
+        if current_room is not None:
             # Player entered our room
             if to_room == current_room:
-                msg = f"\n{player.name} has arrived."
-                self._pending_messages.append(msg)
+                msg = _MSG_ARRIVED % player.name
 
             # Player left our room
             elif from_room == current_room:
-                msg = f"\n{player.name} has left."
-                self._pending_messages.append(msg)
+                msg = _MSG_LEFT % player.name
 
             # Update OLED display with current room players
-            if self._display:
-                players = self.get_players_in_room(current_room)
-                player_names = [p.name for p in players]
-                self._display.set_players_in_room(player_names)
+            self._mark_display_dirty()
 
-        for callback in self._on_player_move:
-            try:
-                callback(player, from_room, to_room)
-            except Exception:
-                pass
+        # Moves between other rooms with no subscribers need no event
+        if msg is None and not self._callbacks[_EVENT_MOVE]:
+            return
+        self._add_event(_EVENT_MOVE, msg, (player, from_room, to_room))
+
+    def _handle_player_room_change(
+        self, player: PlayerInfo, from_room: str | None, to_room: str
+    ) -> None:
+        """Re-index a player whose room or name changed without a move message."""
+        self._index_player(player, to_room)
+
+        current_room = self._current_room
+        if current_room is not None and current_room in (from_room, to_room):
+            self._mark_display_dirty()
 
     def _handle_player_action(self, player: PlayerInfo, verb: str, obj_id: str | None) -> None:
         """Handle remote player performing action."""
-        if self._game:
-            current_room = self._game.state.current_room
+        in_room = player.room_id == self._current_room
 
-            # Only show actions in same room
-            if player.room_id == current_room:
-                if obj_id:
-                    msg = f"\n{player.name} {verb}s the {obj_id}."
-                else:
-                    msg = f"\n{player.name} {verb}s."
-                self._pending_messages.append(msg)
+        # Actions elsewhere on the mesh with no subscribers need no work
+        if not in_room and not self._callbacks[_EVENT_ACTION]:
+            return
 
-        for callback in self._on_player_action:
-            try:
-                callback(player, verb, obj_id)
-            except Exception:
-                pass
+        # Only show actions in same room
+        msg = None
+        if in_room:
+            if obj_id:
+                msg = _MSG_ACTION_OBJ % (player.name, verb, obj_id)
+            else:
+                msg = _MSG_ACTION % (player.name, verb)
+        self._add_event(_EVENT_ACTION, msg, (player, verb, obj_id))
 
     def _handle_chat(self, player: PlayerInfo, message: str, is_team: bool) -> None:
         """Handle chat message."""
         if is_team:
-            msg = f"\n[Team] {player.name}: {message}"
+            msg = _MSG_TEAM % (player.name, message)
         else:
-            msg = f"\n{player.name} says: \"{message}\""
-        self._pending_messages.append(msg)
+            msg = _MSG_CHAT % (player.name, message)
 
         # Update OLED display with message
-        if self._display:
-            display_msg = f"{player.name}: {message}"
-            self._display.add_message(display_msg)
+        self._display_add_message(f"{player.name}: {message}")
 
-        for callback in self._on_chat:
-            try:
-                callback(player, message, is_team)
-            except Exception:
-                pass
+        self._add_event(_EVENT_CHAT, msg, (player, message, is_team))
 
     # =========================================================================
     # Game integration
     # =========================================================================
 
+    def _add_event(self, kind: str, msg: str | None, args: tuple) -> None:
+        """Queue a remote event for the game loop, dropping the oldest if full.
+
+        Args:
+            kind: One of the _EVENT_* kinds, selecting the callbacks to run.
+            msg: Line to show the player, or None if there is nothing to show.
+            args: Arguments for the registered callbacks.
+        """
+        if len(self._pending_events) == MAX_PENDING_EVENTS:
+            logger.debug("Pending event buffer full, dropping oldest")
+        self._pending_events.append((kind, msg, args))
+
     def get_pending_messages(self) -> list[str]:
-        """Get and clear pending messages for display."""
-        messages = self._pending_messages.copy()
-        self._pending_messages.clear()
-        return messages
+        """Drain pending remote events.
+
+        Registered callbacks run here, on the caller's (game) thread, in the
+        order the events arrived. Display lines are deduplicated: only the
+        latest join, leave or move line per player is kept, and repeated
+        identical chat or action lines are shown once.
+
+        Returns:
+            Lines to display for the drained events.
+        """
+        # popleft() rather than copy-and-clear so events appended by the
+        # network thread mid-drain are kept for the next call
+        pending = self._pending_events
+        lines: dict[tuple, str] = {}
+        while pending:
+            kind, msg, args = pending.popleft()
+            if msg is not None:
+                player_id = args[0].player_id
+                if kind in _LATEST_ONLY_EVENTS:
+                    key = (player_id, kind)
+                else:
+                    key = (player_id, kind, msg)
+                # Re-inserting moves the line to where its latest event fell
+                lines.pop(key, None)
+                lines[key] = msg
+            self._dispatch(kind, *args)
+        return list(lines.values())
+
+    def _dispatch(self, kind: str, *args) -> None:
+        """Run the callbacks registered for an event kind."""
+        callbacks = self._callbacks[kind]
+        if not callbacks:
+            return
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception:
+                logger.debug("Multiplayer %s callback failed", kind, exc_info=True)
 
     def get_players_in_room(self, room_id: str) -> list[PlayerInfo]:
         """Get other players in a room."""
@@ -441,17 +752,25 @@ class MultiplayerManager:
 
     def format_players_in_room(self, room_id: str) -> str | None:
         """Format a string describing other players in the room."""
-        players = self.get_players_in_room(room_id)
-        if not players:
-            return None
+        with self._room_lock:
+            try:
+                return self._players_here[room_id]
+            except KeyError:
+                pass
 
-        names = [p.name for p in players]
-        if len(names) == 1:
-            return f"{names[0]} is here."
-        elif len(names) == 2:
-            return f"{names[0]} and {names[1]} are here."
-        else:
-            return f"{', '.join(names[:-1])}, and {names[-1]} are here."
+            names = list(self._room_index.get(room_id, {}).values())
+            n = len(names)
+            if n == 0:
+                text = None
+            elif n == 1:
+                text = names[0] + " is here."
+            elif n == 2:
+                text = names[0] + " and " + names[1] + " are here."
+            else:
+                last = names.pop()
+                text = ", ".join(names) + ", and " + last + " are here."
+            self._players_here[room_id] = text
+            return text
 
     # =========================================================================
     # Callback registration
@@ -459,35 +778,44 @@ class MultiplayerManager:
 
     def on_player_join(self, callback: Callable[[PlayerInfo], None]) -> None:
         """Register callback for player joins."""
-        self._on_player_join.append(callback)
+        self._callbacks[_EVENT_JOIN] += (callback,)
 
     def on_player_leave(self, callback: Callable[[PlayerInfo], None]) -> None:
         """Register callback for player leaves."""
-        self._on_player_leave.append(callback)
+        self._callbacks[_EVENT_LEAVE] += (callback,)
 
     def on_player_move(self, callback: Callable[[PlayerInfo, str, str], None]) -> None:
         """Register callback for player moves."""
-        self._on_player_move.append(callback)
+        self._callbacks[_EVENT_MOVE] += (callback,)
 
     def on_player_action(self, callback: Callable[[PlayerInfo, str, str | None], None]) -> None:
         """Register callback for player actions."""
-        self._on_player_action.append(callback)
+        self._callbacks[_EVENT_ACTION] += (callback,)
 
     def on_chat(self, callback: Callable[[PlayerInfo, str, bool], None]) -> None:
         """Register callback for chat messages."""
-        self._on_chat.append(callback)
+        self._callbacks[_EVENT_CHAT] += (callback,)
 
 
 # Global multiplayer instance
 _multiplayer: MultiplayerManager | None = None
 
 
+@functools.cache
+def _mp_enabled() -> bool:
+    """Check once whether multiplayer is enabled in config.
+
+    init_multiplayer() clears this so a re-init picks up config changes;
+    tests can call _mp_enabled.cache_clear() directly.
+    """
+    return get_config().mqtt.enabled
+
+
 def get_multiplayer() -> MultiplayerManager | None:
     """Get the global multiplayer manager, if enabled."""
     global _multiplayer
-    config = get_config()
 
-    if not config.mqtt.enabled:
+    if not _mp_enabled():
         return None
 
     if _multiplayer is None:
@@ -506,9 +834,9 @@ def init_multiplayer(player_name: str | None = None) -> MultiplayerManager | Non
         MultiplayerManager if connected, None otherwise.
     """
     global _multiplayer
-    config = get_config()
+    _mp_enabled.cache_clear()
 
-    if not config.mqtt.enabled:
+    if not _mp_enabled():
         return None
 
     _multiplayer = MultiplayerManager(player_name)
@@ -16,6 +16,7 @@ import logging
 import socket
 import threading
 import time
+from collections import deque
 from typing import Any
 
 from pymeshzork.meshtastic.client import MeshtasticClient, ConnectionState
@@ -32,6 +33,21 @@ logger = logging.getLogger(__name__)
 # Default meshtasticd TCP port
 DEFAULT_TCP_PORT = 4403
 
+# Meshtastic PortNum.PRIVATE_APP, carrying our game data
+PRIVATE_APP_PORT = 256
+
+# How long to wait for meshtasticd to report the connection established
+CONNECT_TIMEOUT = 5.0  # seconds
+
+# Outgoing messages are packed newline-separated into one PRIVATE_APP packet
+# of up to this many bytes (below meshtastic's 233-byte DATA_PAYLOAD_LEN),
+# gathered over at most this long
+NATIVE_MAX_PAYLOAD = 200
+NATIVE_BATCH_WINDOW = 0.1  # seconds
+
+# Sends of a packet before it is dropped, as for the base client's queue
+NATIVE_MAX_ATTEMPTS = 3
+
 
 class NativeClient(MeshtasticClient):
     """Meshtastic client using meshtasticd TCP interface.
@@ -70,6 +86,17 @@ class NativeClient(MeshtasticClient):
         self.host = host
         self.port = port
         self._interface: Any = None  # meshtastic.tcp_interface.TCPInterface
+        self._connected_event = threading.Event()
+
+        # Encoded messages waiting for the TX thread to pack and send
+        self._tx_queue: deque[bytes] = deque()
+        # Packet whose send failed, retried before anything new is packed
+        self._tx_retry: bytes | None = None
+        self._tx_attempts = 0
+        self._tx_lock = threading.Lock()
+        self._tx_wake = threading.Event()
+        self._tx_thread: threading.Thread | None = None
+        self._running = False
 
         # OLED display
         self._display = get_display()
@@ -88,17 +115,6 @@ class NativeClient(MeshtasticClient):
             )
             return False
 
-    def _check_meshtasticd(self) -> bool:
-        """Check if meshtasticd is running and accessible."""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((self.host, self.port))
-            sock.close()
-            return result == 0
-        except Exception:
-            return False
-
     def connect(self) -> bool:
         """Connect to meshtasticd via TCP.
 
@@ -114,29 +130,38 @@ class NativeClient(MeshtasticClient):
 
         self._set_state(ConnectionState.CONNECTING)
 
-        # Check if meshtasticd is running
-        if not self._check_meshtasticd():
-            logger.error(
-                f"meshtasticd not running at {self.host}:{self.port}. "
-                "Start it with: sudo systemctl start meshtasticd"
-            )
-            self._set_state(ConnectionState.ERROR)
-            return False
-
         try:
             import meshtastic.tcp_interface
             from pubsub import pub
 
             logger.info(f"Connecting to meshtasticd at {self.host}:{self.port}")
 
-            # Connect via TCP interface
-            self._interface = meshtastic.tcp_interface.TCPInterface(
-                hostname=self.host,
-                portNumber=self.port,
-            )
+            # The library announces readiness over pubsub; subscribe before
+            # connecting so the event can't be missed
+            self._connected_event.clear()
+            pub.subscribe(self._on_connection_established, "meshtastic.connection.established")
+
+            # Connect via TCP interface; a refused or unreachable socket
+            # surfaces here, so there is no separate probe connection
+            try:
+                self._interface = meshtastic.tcp_interface.TCPInterface(
+                    hostname=self.host,
+                    portNumber=self.port,
+                )
+            except OSError as e:
+                logger.error(
+                    f"meshtasticd not running at {self.host}:{self.port} ({e}). "
+                    "Start it with: sudo systemctl start meshtasticd"
+                )
+                pub.unsubscribe(
+                    self._on_connection_established, "meshtastic.connection.established"
+                )
+                self._set_state(ConnectionState.ERROR)
+                return False
 
             # Wait for connection to establish
-            time.sleep(2)
+            if not self._connected_event.wait(CONNECT_TIMEOUT):
+                logger.warning("meshtasticd did not report ready; continuing anyway")
 
             # Get node info
             node_info = self._interface.getMyNodeInfo()
@@ -147,6 +172,15 @@ class NativeClient(MeshtasticClient):
             # Subscribe to received messages
             pub.subscribe(self._on_receive, "meshtastic.receive")
 
+            # Start the batching TX thread
+            self._running = True
+            self._tx_thread = threading.Thread(
+                target=self._tx_loop,
+                daemon=True,
+                name="native-tx",
+            )
+            self._tx_thread.start()
+
             self._set_state(ConnectionState.CONNECTED)
 
             # Start heartbeat
@@ -177,17 +211,22 @@ class NativeClient(MeshtasticClient):
         try:
             from pubsub import pub
             pub.unsubscribe(self._on_receive, "meshtastic.receive")
+            pub.unsubscribe(self._on_connection_established, "meshtastic.connection.established")
         except Exception:
             pass
 
         if self._interface:
             try:
                 self.send_leave()
-                time.sleep(0.2)
+                # The TX thread drains whatever is queued before exiting;
+                # the short pause lets meshtasticd take the last packet
+                self._stop_tx_thread()
+                time.sleep(0.05)
                 self._interface.close()
             except Exception as e:
                 logger.debug(f"Error during disconnect: {e}")
             self._interface = None
+        self._stop_tx_thread()
 
         # Update display
         if self._display:
@@ -196,41 +235,120 @@ class NativeClient(MeshtasticClient):
         self._set_state(ConnectionState.DISCONNECTED)
         logger.info("Native client disconnected")
 
-    def _send_raw(self, data: str) -> None:
-        """Send raw data via meshtasticd.
+    def _send_raw(self, data: bytes) -> None:
+        """Queue raw data for the TX thread to send via meshtasticd.
 
         Args:
-            data: JSON-encoded message string.
+            data: JSON-encoded message bytes.
 
         Raises:
-            RuntimeError: If not connected or send fails.
+            RuntimeError: If not connected or the payload is too large for
+                one packet.
         """
         if not self._interface or self._state != ConnectionState.CONNECTED:
             raise RuntimeError("Not connected to meshtasticd")
+        if len(data) > NATIVE_MAX_PAYLOAD:
+            raise RuntimeError(
+                f"Payload of {len(data)} bytes exceeds packet limit ({NATIVE_MAX_PAYLOAD} bytes)"
+            )
 
-        try:
-            from meshtastic import portnums_pb2
-
-            # Convert string to bytes
-            data_bytes = data.encode("utf-8")
+        with self._tx_lock:
+            self._tx_queue.append(data)
+        self._tx_wake.set()
+
+    def _stop_tx_thread(self) -> None:
+        """Stop the TX thread once it has sent anything still queued."""
+        self._running = False
+        self._tx_wake.set()
+        if self._tx_thread:
+            self._tx_thread.join(timeout=2.0)
+            self._tx_thread = None
+
+    def _tx_loop(self) -> None:
+        """Background thread that packs queued messages into as few packets as fit."""
+        while True:
+            self._tx_wake.wait()
+            self._tx_wake.clear()
+            running = self._running
+            if running:
+                # Let the rest of a burst arrive so it shares a packet
+                time.sleep(NATIVE_BATCH_WINDOW)
+
+            while True:
+                payload = self._next_payload()
+                if payload is None:
+                    break
+                if not self._transmit(payload):
+                    # Kept for a retry when the next send wakes us
+                    break
+
+            if not running:
+                break
+
+    def _next_payload(self) -> bytes | None:
+        """Pop queued messages that fit in one packet, joined by newlines.
+
+        A packet whose send failed is returned again, unchanged, first.
+        """
+        with self._tx_lock:
+            if self._tx_retry is not None:
+                payload, self._tx_retry = self._tx_retry, None
+                return payload
+            queue = self._tx_queue
+            if not queue:
+                return None
+            parts = [queue.popleft()]
+            size = len(parts[0])
+            while queue and size + 1 + len(queue[0]) <= NATIVE_MAX_PAYLOAD:
+                data = queue.popleft()
+                parts.append(data)
+                size += 1 + len(data)
+        return parts[0] if len(parts) == 1 else b"\n".join(parts)
+
+    def _transmit(self, payload: bytes) -> bool:
+        """Send one packed payload as private app data to all nodes.
+
+        Connection errors are retried up to NATIVE_MAX_ATTEMPTS sends; any
+        other error means meshtasticd rejected the packet, which is dropped.
 
-            # Send as private app data to all nodes (broadcast)
-            self._interface.sendData(
-                data=data_bytes,
-                portNum=portnums_pb2.PortNum.PRIVATE_APP,
+        Returns:
+            False if the payload was kept to retry, True once it is done with.
+        """
+        interface = self._interface
+        try:
+            if interface is None:
+                raise ConnectionError("not connected to meshtasticd")
+            interface.sendData(
+                data=payload,
+                portNum=PRIVATE_APP_PORT,
                 wantAck=False,
                 wantResponse=False,
             )
 
-            logger.debug(f"Sent {len(data_bytes)} bytes via meshtasticd")
+            logger.debug("Sent %d bytes via meshtasticd", len(payload))
 
             # Flash TX indicator on display
             if self._display:
                 self._display.show_tx()
 
+        except OSError as e:
+            self._tx_attempts += 1
+            if self._tx_attempts < NATIVE_MAX_ATTEMPTS:
+                logger.warning(f"Failed to send message, will retry: {e}")
+                with self._tx_lock:
+                    self._tx_retry = payload
+                return False
+            logger.error(f"Dropping message after {self._tx_attempts} failed sends: {e}")
+
         except Exception as e:
-            logger.error(f"Failed to send message: {e}")
-            raise
+            logger.error(f"Dropping message meshtasticd rejected: {e}")
+
+        self._tx_attempts = 0
+        return True
+
+    def _on_connection_established(self, interface: Any = None, **kwargs: Any) -> None:
+        """Handle meshtasticd reporting that the connection is ready."""
+        self._connected_event.set()
 
     def _on_receive(self, packet: dict, interface: Any = None) -> None:
         """Handle received Meshtastic packet.
@@ -240,9 +358,6 @@ class NativeClient(MeshtasticClient):
             interface: The interface that received the packet.
         """
         try:
-            # PRIVATE_APP portnum = 256
-            PRIVATE_APP_PORTNUM = 256
-
             # Only process private app messages (our game data)
             decoded = packet.get("decoded", {})
             port_num = decoded.get("portnum")
@@ -251,7 +366,7 @@ class NativeClient(MeshtasticClient):
             if isinstance(port_num, str):
                 if port_num != "PRIVATE_APP":
                     return
-            elif port_num != PRIVATE_APP_PORTNUM:
+            elif port_num != PRIVATE_APP_PORT:
                 return
 
             # Get the payload
@@ -259,17 +374,14 @@ class NativeClient(MeshtasticClient):
             if not payload:
                 return
 
-            # Decode bytes to string
-            if isinstance(payload, bytes):
-                json_str = payload.decode("utf-8")
-            else:
-                json_str = str(payload)
+            # Bytes go straight to the decoder, with no UTF-8 round trip
+            if not isinstance(payload, (bytes, str)):
+                payload = str(payload)
 
-            # Parse and handle the game message
-            self._handle_incoming(json_str)
+            # Parse and handle the game message(s) packed in the packet
+            self._handle_incoming(payload)
 
-            from_id = packet.get("fromId", "unknown")
-            logger.debug(f"Received game message from {from_id}")
+            logger.debug("Received game message from %s", packet.get("fromId", "unknown"))
 
             # Update display with RX indicator and signal info
             if self._display:
@@ -281,7 +393,7 @@ class NativeClient(MeshtasticClient):
                     self._display.update_signal(rssi=rssi, snr=snr)
 
         except Exception as e:
-            logger.debug(f"Failed to process received packet: {e}")
+            logger.debug("Failed to process received packet: %s", e)
 
     def get_node_info(self) -> dict | None:
         """Get information about the meshtasticd node.
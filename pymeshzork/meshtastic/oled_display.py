@@ -105,6 +105,10 @@ class OLEDDisplay:
         self._font = None
         self._font_small = None
 
+        # Frame buffer, created once and redrawn in place by _render
+        self._image = None
+        self._draw = None
+
     @property
     def initialized(self) -> bool:
         """Check if display is initialized."""
@@ -135,8 +139,10 @@ class OLEDDisplay:
             self._display.fill(0)
             self._display.show()
 
-            # Load fonts
+            # Load fonts and set up the frame buffer
             self._load_fonts()
+            self._image = Image.new("1", (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+            self._draw = ImageDraw.Draw(self._image)
 
             self._initialized = True
 
@@ -283,11 +289,9 @@ class OLEDDisplay:
             return
 
         try:
-            from PIL import Image, ImageDraw
-
-            # Create image buffer
-            image = Image.new("1", (DISPLAY_WIDTH, DISPLAY_HEIGHT))
-            draw = ImageDraw.Draw(image)
+            draw = self._draw
+            # Clear the frame buffer
+            draw.rectangle((0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT), fill=0)
 
             with self._lock:
                 if self._mode == DisplayMode.STATUS:
@@ -303,7 +307,7 @@ class OLEDDisplay:
                 self._render_activity(draw)
 
             # Display the image
-            self._display.image(image)
+            self._display.image(self._image)
             self._display.show()
 
         except Exception as e:
@@ -82,6 +82,7 @@ class PresenceManager:
         self._on_move: list[Callable[[PlayerInfo, str, str], None]] = []
         self._on_action: list[Callable[[PlayerInfo, str, str | None], None]] = []
         self._on_chat: list[Callable[[PlayerInfo, str, bool], None]] = []
+        self._on_room_change: list[Callable[[PlayerInfo, str | None, str], None]] = []
 
         # Cleanup thread
         self._cleanup_interval = 30  # seconds
@@ -154,7 +155,7 @@ class PresenceManager:
         name = msg.data.get("n", msg.player_id)
 
         with self._lock:
-            is_new = msg.player_id not in self._players
+            previous = self._players.get(msg.player_id)
             player = PlayerInfo(
                 player_id=msg.player_id,
                 name=name,
@@ -162,12 +163,15 @@ class PresenceManager:
             )
             self._players[msg.player_id] = player
 
-        if is_new:
+        if previous is None:
             for callback in self._on_join:
                 try:
                     callback(player)
                 except Exception:
                     pass
+        elif previous.room_id != room_id or previous.name != name:
+            # A re-join (e.g. after a restart) can move or rename a known player
+            self._notify_room_change(player, previous.room_id)
 
     def _handle_leave(self, msg: GameMessage) -> None:
         """Handle player leave message."""
@@ -216,10 +220,15 @@ class PresenceManager:
 
         with self._lock:
             player = self._players.get(msg.player_id)
+            old_room = None
             if player:
+                old_room = player.room_id
                 player.room_id = room_id
                 player.update_seen()
 
+        if player and old_room != room_id:
+            self._notify_room_change(player, old_room)
+
     def _handle_action(self, msg: GameMessage) -> None:
         """Handle player action message."""
         verb = msg.data.get("v", "")
@@ -246,6 +255,7 @@ class PresenceManager:
         is_team = msg.type == MessageType.TEAM_CHAT
         player_name = msg.data.get("n")  # Name included in chat messages
 
+        changed = False
         with self._lock:
             player = self._players.get(msg.player_id)
             if player:
@@ -253,6 +263,8 @@ class PresenceManager:
                 # Update name if we learned it
                 if player_name and player.name == player.player_id:
                     player.name = player_name
+                    changed = True
+                old_room = player.room_id
             else:
                 # Create player info from chat
                 player = PlayerInfo(
@@ -261,6 +273,11 @@ class PresenceManager:
                     room_id=ROOM_NAMES.get(msg.data.get("r", 0), ""),
                 )
                 self._players[msg.player_id] = player
+                old_room = None
+                changed = True
+
+        if changed:
+            self._notify_room_change(player, old_room)
 
         for callback in self._on_chat:
             try:
@@ -292,6 +309,23 @@ class PresenceManager:
         """Register callback for chat messages (player, message, is_team)."""
         self._on_chat.append(callback)
 
+    def on_room_change(self, callback: Callable[[PlayerInfo, str | None, str], None]) -> None:
+        """Register callback for room or name changes outside join/move/leave.
+
+        Called as (player, old_room, new_room) when a heartbeat, a repeated
+        join or a chat message changes a player's room or name, or adds a
+        player first seen through chat (old_room is then None).
+        """
+        self._on_room_change.append(callback)
+
+    def _notify_room_change(self, player: PlayerInfo, old_room: str | None) -> None:
+        """Run room-change callbacks for a player."""
+        for callback in self._on_room_change:
+            try:
+                callback(player, old_room, player.room_id)
+            except Exception:
+                pass
+
     # =========================================================================
     # Query methods
     # =========================================================================
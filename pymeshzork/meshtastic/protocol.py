@@ -10,6 +10,16 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib codec
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional: only needed for MessagePack payloads
+    msgspec = None
+
 
 # Protocol version for compatibility checking
 PROTOCOL_VERSION = 1
@@ -38,7 +48,11 @@ class MessageType(str, Enum):
     TEAM_CHAT = "TC"        # Team-only chat
 
 
-@dataclass
+# Wire code -> message type, skipping the Enum constructor on every decode
+_MESSAGE_TYPES: dict[str, MessageType] = {t.value: t for t in MessageType}
+
+
+@dataclass(slots=True)
 class GameMessage:
     """A multiplayer game message."""
 
@@ -61,7 +75,9 @@ class GameMessage:
     @classmethod
     def from_compact(cls, data: dict) -> "GameMessage":
         """Parse from compact format."""
-        msg_type = MessageType(data["t"])
+        msg_type = _MESSAGE_TYPES.get(data["t"])
+        if msg_type is None:
+            raise ValueError(f"Unknown message type: {data['t']!r}")
         return cls(
             type=msg_type,
             player_id=data["p"],
@@ -71,16 +87,73 @@ class GameMessage:
         )
 
 
-def encode_message(msg: GameMessage) -> str:
-    """Encode message to JSON string for transmission."""
-    return json.dumps(msg.to_compact(), separators=(",", ":"))
-
-
-def decode_message(data: str | bytes) -> GameMessage:
-    """Decode message from JSON string."""
-    if isinstance(data, bytes):
-        data = data.decode("utf-8")
-    return GameMessage.from_compact(json.loads(data))
+# MessagePack is only available when the optional msgspec package is installed
+PACKED_AVAILABLE = msgspec is not None
+_packer = msgspec.msgpack.Encoder() if PACKED_AVAILABLE else None
+_json_encoder = msgspec.json.Encoder() if PACKED_AVAILABLE else None
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode to compact UTF-8 JSON bytes with the fastest codec installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    if msgspec is not None:
+        return _json_encoder.encode(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def decode_json(data: str | bytes | bytearray | memoryview) -> Any:
+    """Decode JSON from a str or any bytes-like object.
+
+    Raises:
+        ValueError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid JSON payload: {e}") from e
+    if not isinstance(data, str):
+        data = str(data, "utf-8")
+    return json.loads(data)
+
+
+def encode_message(msg: GameMessage) -> bytes:
+    """Encode message to UTF-8 JSON bytes for transmission."""
+    return encode_json(msg.to_compact())
+
+
+def encode_message_packed(msg: GameMessage) -> bytes:
+    """Encode message to MessagePack bytes, which are smaller than JSON.
+
+    Raises:
+        RuntimeError: If msgspec is not installed.
+    """
+    if not PACKED_AVAILABLE:
+        raise RuntimeError("MessagePack encoding requires msgspec")
+    return _packer.encode(msg.to_compact())
+
+
+def decode_message(data: str | bytes | bytearray | memoryview) -> GameMessage:
+    """Decode message from JSON or MessagePack bytes (or a str, for text transports).
+
+    Any bytes-like object is accepted, so callers can pass a view of a
+    received frame without copying it.
+
+    Raises:
+        ValueError: If the payload cannot be decoded.
+    """
+    # JSON messages always start with "{"; anything else is MessagePack
+    if not isinstance(data, str) and data[:1] != b"{":
+        if not PACKED_AVAILABLE:
+            raise ValueError("MessagePack payload received but msgspec is not installed")
+        try:
+            return GameMessage.from_compact(msgspec.msgpack.decode(data))
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid MessagePack payload: {e}") from e
+    return GameMessage.from_compact(decode_json(data))
 
 
 # =============================================================================
@@ -219,11 +219,11 @@ class SerialClient(MeshtasticClient):
         self._set_state(ConnectionState.DISCONNECTED)
         logger.info("Meshtastic serial client disconnected")
 
-    def _send_raw(self, data: str) -> None:
+    def _send_raw(self, data: bytes) -> None:
         """Send raw data via Meshtastic mesh.
 
         Args:
-            data: JSON-encoded message string.
+            data: JSON-encoded message bytes.
 
         Raises:
             RuntimeError: If not connected or send fails.
@@ -234,18 +234,15 @@ class SerialClient(MeshtasticClient):
         try:
             from meshtastic import portnums_pb2
 
-            # Convert string to bytes
-            data_bytes = data.encode("utf-8")
-
             # Send as private app data to all nodes (broadcast)
             self._interface.sendData(
-                data=data_bytes,
+                data=data,
                 portNum=portnums_pb2.PortNum.PRIVATE_APP,
                 wantAck=False,  # Don't wait for ack for faster gameplay
                 wantResponse=False,
             )
 
-            logger.debug(f"Sent {len(data_bytes)} bytes via Meshtastic mesh")
+            logger.debug(f"Sent {len(data)} bytes via Meshtastic mesh")
 
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
@@ -280,14 +277,12 @@ class SerialClient(MeshtasticClient):
             if not payload:
                 return
 
-            # Decode bytes to string
-            if isinstance(payload, bytes):
-                json_str = payload.decode("utf-8")
-            else:
-                json_str = str(payload)
+            # Bytes go straight to the decoder, with no UTF-8 round trip
+            if not isinstance(payload, (bytes, str)):
+                payload = str(payload)
 
             # Parse and handle the game message
-            self._handle_incoming(json_str)
+            self._handle_incoming(payload)
 
             # Log reception
             from_id = packet.get("fromId", "unknown")
@@ -8,6 +8,7 @@ from pymeshzork.engine.models import (
     Exit,
     Object,
     ObjectFlag1,
+    PuzzleFlag,
     Room,
     RoomFlag,
 )
@@ -127,6 +128,63 @@ class TestWorld:
         world.add_room(room)
         assert world.get_room("test") == room
 
+    def test_door_ids(self):
+        """Test door objects are indexed as they are added."""
+        world = World()
+        world.add_object(Object(
+            id="door",
+            name="wooden door",
+            flags1=ObjectFlag1.VISIBT | ObjectFlag1.DOORBT,
+        ))
+        world.add_object(Object(id="lamp", name="lamp"))
+
+        assert world.door_ids == {"door"}
+
+    def test_find_exit(self):
+        """Test exits are looked up by direction and refreshed by set_exits."""
+        world = World()
+        room = Room(
+            id="test",
+            name="Test Room",
+            description_first="A test room.",
+            description_short="Test",
+            exits=[Exit(Direction.NORTH, "a"), Exit(Direction.NORTH, "b")],
+        )
+        world.add_room(room)
+
+        assert world.find_exit(room, Direction.NORTH).destination_id == "a"
+        assert world.find_exit(room, Direction.SOUTH) is None
+
+        room.set_exits([Exit(Direction.SOUTH, "c")])
+        assert world.find_exit(room, Direction.NORTH) is None
+        assert world.find_exit(room, Direction.SOUTH).destination_id == "c"
+
+    def test_room_lit_by_lamp(self):
+        """Test a dark room is lit only while a carried lamp is on."""
+        world = World()
+        state = GameState()
+        cellar = Room(
+            id="cellar",
+            name="Cellar",
+            description_first="A dark cellar.",
+            description_short="Cellar",
+            flags=RoomFlag.RLAND,
+        )
+        world.add_room(cellar)
+        world.add_object(Object(
+            id="lamp",
+            name="lamp",
+            flags1=ObjectFlag1.VISIBT | ObjectFlag1.TAKEBT | ObjectFlag1.LITEBT,
+        ))
+        state.move_object_to_actor("lamp", "player")
+        assert not world.is_room_lit(state, cellar)
+
+        state.get_object_state("lamp").flags1 |= ObjectFlag1.ONBT
+        assert world.is_room_lit(state, cellar)
+
+        state.get_object_state("lamp").flags1 &= ~ObjectFlag1.ONBT
+        assert not world.is_room_lit(state, cellar)
+
     def test_movement(self):
         """Test movement between rooms."""
         world = World()
@@ -179,6 +237,31 @@ class TestGameState:
         assert "sword" not in state.objects_in_room("lroom")
         assert "sword" in state.objects_held_by("player")
 
+    def test_location_cache_invalidation(self):
+        """Test cached location queries see direct location changes."""
+        state = GameState()
+        state.move_object_to_room("lamp", "whous")
+        assert state.objects_in_room("whous") == ["lamp"]
+
+        state.get_object_state("lamp").room_id = "lroom"
+        assert state.objects_in_room("whous") == []
+        assert state.objects_in_room("lroom") == ["lamp"]
+
+    def test_location_indexes(self):
+        """Test reverse location indexes follow moves and survive reload."""
+        state = GameState()
+        state.move_object_to_actor("lamp", "player")
+        state.move_object_to_container("coin", "bag")
+        assert state.objects_held_by("player") == ["lamp"]
+        assert state.objects_in_container("bag") == ["coin"]
+
+        state.move_object_to_room("lamp", "kitchen")
+        assert state.objects_held_by("player") == []
+
+        loaded = GameState.from_dict(state.to_dict())
+        assert loaded.objects_in_room("kitchen") == ["lamp"]
+        assert loaded.objects_in_container("bag") == ["coin"]
+
     def test_serialization(self):
         """Test save/load of game state."""
         state = GameState()
@@ -196,6 +279,17 @@ class TestGameState:
         assert loaded.score == 42
         assert loaded.moves == 100
 
+    def test_puzzle_flags_serialization(self):
+        """Test packed puzzle flags survive save/load, including old saves."""
+        state = GameState()
+        state.puzzle_flags |= PuzzleFlag.RUG_MOVED | PuzzleFlag.ROPE_TIED
+
+        loaded = GameState.from_dict(state.to_dict())
+        assert loaded.puzzle_flags == PuzzleFlag.RUG_MOVED | PuzzleFlag.ROPE_TIED
+
+        legacy = GameState.from_dict({"flags": {"grate_open": True, "rug_moved": False}})
+        assert legacy.puzzle_flags == PuzzleFlag.GRATE_OPEN
+
 
 class TestGame:
     """Tests for main game engine."""
@@ -2,13 +2,17 @@
 
 import json
 import time
+from types import SimpleNamespace
+
 import pytest
 
 from pymeshzork.meshtastic.protocol import (
     MessageType,
     GameMessage,
     PROTOCOL_VERSION,
+    PACKED_AVAILABLE,
     encode_message,
+    encode_message_packed,
     decode_message,
     create_join_message,
     create_leave_message,
@@ -23,6 +27,34 @@ from pymeshzork.meshtastic.protocol import (
     OBJECT_NAMES,
 )
 from pymeshzork.meshtastic.presence import PresenceManager, PlayerInfo
+from pymeshzork.meshtastic.client import MeshtasticClient, ConnectionState
+from pymeshzork.meshtastic.hybrid_transport import (
+    HybridTransport,
+    LRUCache,
+    TransportType,
+)
+from pymeshzork.meshtastic.multiplayer import MultiplayerManager
+
+
+class LoopbackClient(MeshtasticClient):
+    """Client that records sent data instead of using a network."""
+
+    def __init__(self, player_name: str = "Tester"):
+        super().__init__(player_name)
+        self.sent: list = []
+        self.fail = False
+
+    def connect(self) -> bool:
+        self._set_state(ConnectionState.CONNECTED)
+        return True
+
+    def disconnect(self) -> None:
+        self._set_state(ConnectionState.DISCONNECTED)
+
+    def _send_raw(self, data) -> None:
+        if self.fail:
+            raise ConnectionError("link down")
+        self.sent.append(data)
 
 
 class TestProtocol:
@@ -109,11 +141,30 @@ class TestProtocol:
         encoded = encode_message(msg)
 
         # Should have no spaces (compact JSON)
-        assert " " not in encoded
+        assert b" " not in encoded
         # Should be valid JSON
         parsed = json.loads(encoded)
         assert parsed["t"] == "HB"
 
+    def test_decode_from_frame_view(self):
+        """Test decoding straight from a view into a received frame."""
+        frame = b"\x00\x00\x00" + encode_message(create_heartbeat("abc123", "whous", seq=2))
+
+        decoded = decode_message(memoryview(frame)[3:])
+        assert decoded.type == MessageType.HEARTBEAT
+        assert decoded.sequence == 2
+
+    @pytest.mark.skipif(not PACKED_AVAILABLE, reason="msgspec not installed")
+    def test_packed_roundtrip(self):
+        """Test MessagePack payloads are smaller and decode like JSON ones."""
+        msg = create_chat_message("abc123", "Hello world!", "whous", seq=4)
+        packed = encode_message_packed(msg)
+
+        assert len(packed) < len(encode_message(msg))
+        decoded = decode_message(packed)
+        assert decoded.data == msg.data
+        assert decoded.sequence == 4
+
 
 class TestMessageFactories:
     """Tests for message factory functions."""
@@ -365,6 +416,606 @@ class TestPresenceManager:
         assert player.is_stale(timeout=180)
 
 
+class TestClient:
+    """Tests for the base client behaviour."""
+
+    def test_player_id_is_stable(self):
+        """Test player IDs are short and derived only from the name."""
+        a = LoopbackClient("Alice")
+        assert len(a.player_id) == 6
+        assert a.player_id == LoopbackClient("Alice").player_id
+        assert a.player_id != LoopbackClient("Bob").player_id
+
+    def test_duplicate_messages_dropped(self):
+        """Test a repeated sequence number is only delivered once."""
+        client = LoopbackClient("Alice")
+        received = []
+        client.on_message(received.append)
+
+        msg = create_chat_message("bob123", "hi", "whous")
+        msg.sequence = 7
+        data = encode_message(msg)
+        client._handle_incoming(data)
+        client._handle_incoming(data)
+
+        assert len(received) == 1
+
+    def test_flush_requeues_on_failure(self):
+        """Test a failed flush keeps unsent messages queued in order."""
+        client = LoopbackClient("Alice")
+        for text in ("one", "two", "three"):
+            client.send_chat(text)
+        assert len(client._outgoing_queue) == 3
+
+        client.connect()
+        client.fail = True
+        client._flush_queue()
+        assert [q.message.data["m"] for q in client._outgoing_queue] == [
+            "one", "two", "three",
+        ]
+
+        client.fail = False
+        client._flush_queue()
+        assert len(client.sent) == 3
+        assert not client._outgoing_queue
+
+    def test_state_callback_can_read_state(self):
+        """Test state callbacks run without holding the state lock."""
+        client = LoopbackClient("Alice")
+        seen = []
+        client.on_state_change(lambda state: seen.append(client.state))
+
+        client.connect()
+
+        assert seen == [ConnectionState.CONNECTED]
+
+    def test_send_queues_until_connected(self):
+        """Test sends while offline are delivered in order on reconnect."""
+        client = LoopbackClient("Alice")
+        assert client.send_chat("first") is False
+
+        client.connect()
+        assert client.send_chat("second") is True
+
+        texts = [decode_message(data).data["m"] for data in client.sent]
+        assert texts == ["first", "second"]
+
+    def test_out_of_order_sequences(self):
+        """Test late messages are accepted once and repeats are dropped."""
+        client = LoopbackClient("Alice")
+        delivered = [
+            seq for seq in (1, 2, 5, 3, 3, 4, 2, 6)
+            if not client._is_duplicate("bob123", seq)
+        ]
+        assert delivered == [1, 2, 5, 3, 4, 6]
+
+    def test_restarted_peer_not_deduplicated(self):
+        """Test a peer whose sequence numbers restart is heard again."""
+        from pymeshzork.meshtastic.client import _DEDUP_WINDOW
+
+        client = LoopbackClient("Alice")
+        received = []
+        client.on_message(received.append)
+
+        # Restart announced by a fresh join
+        for seq in (1, 2, 3):
+            client._handle_incoming(encode_message(create_chat_message("bob123", "hi", seq=seq)))
+        client._handle_incoming(encode_message(create_join_message("bob123", "Bob", "whous", seq=1)))
+        client._handle_incoming(encode_message(create_chat_message("bob123", "back", seq=2)))
+        assert [m.sequence for m in received] == [1, 2, 3, 1, 2]
+
+        # Restart seen only through a large backwards jump
+        last = _DEDUP_WINDOW + 10
+        assert not client._is_duplicate("carol1", last)
+        assert not client._is_duplicate("carol1", 1)
+        assert not client._is_duplicate("carol1", 2)
+        assert client._is_duplicate("carol1", 2)
+
+
+    def test_packed_payload_split(self):
+        """Test a payload packing several JSON messages delivers each of them."""
+        client = LoopbackClient("Alice")
+        received = []
+        client.on_message(received.append)
+
+        payload = b"\n".join(
+            encode_message(create_heartbeat(f"abc{i:03d}", "whous")) for i in range(3)
+        )
+        client._handle_incoming(payload)
+        client._handle_incoming(payload.decode("utf-8").replace("abc", "def"))
+
+        assert [m.player_id for m in received] == [
+            "abc000", "abc001", "abc002", "def000", "def001", "def002",
+        ]
+
+
+class TestSerialClient:
+    """Tests for the serial Meshtastic client."""
+
+    def test_receives_packed_payload(self):
+        """Test packets packing several messages are split on the serial path."""
+        pytest.importorskip("meshtastic")
+        from pymeshzork.meshtastic.serial_client import SerialClient
+
+        client = SerialClient("Bob")
+        received = []
+        client.on_message(received.append)
+        payload = b"\n".join(
+            encode_message(create_heartbeat(f"abc{i:03d}", "whous")) for i in range(3)
+        )
+
+        client._on_receive({"decoded": {"portnum": "PRIVATE_APP", "payload": payload}})
+
+        assert [m.player_id for m in received] == ["abc000", "abc001", "abc002"]
+
+
+class TestNativeClient:
+    """Tests for the meshtasticd client's packet batching."""
+
+    def test_packs_and_splits_messages(self):
+        """Test queued messages share packets up to the size limit and split on receipt."""
+        from pymeshzork.meshtastic.native_client import NativeClient, NATIVE_MAX_PAYLOAD
+
+        sender, receiver = NativeClient("Alice"), NativeClient("Bob")
+        received = []
+        receiver.on_message(received.append)
+        for i in range(6):
+            msg = create_heartbeat(f"abc{i:03d}", "whous")
+            sender._tx_queue.append(encode_message(msg))
+
+        payloads = []
+        while (payload := sender._next_payload()) is not None:
+            payloads.append(payload)
+        for payload in payloads:
+            receiver._on_receive({"decoded": {"portnum": "PRIVATE_APP", "payload": payload}})
+
+        assert len(payloads) < 6
+        assert all(len(p) <= NATIVE_MAX_PAYLOAD for p in payloads)
+        assert [m.player_id for m in received] == [f"abc{i:03d}" for i in range(6)]
+
+    def test_failed_send_retried(self):
+        """Test a packet that fails to send is retried first, as it was packed."""
+        from pymeshzork.meshtastic.native_client import NativeClient
+
+        client = NativeClient("Alice")
+        sent = []
+
+        class FlakyInterface:
+            fail = True
+
+            def sendData(self, data, **kwargs):
+                if self.fail:
+                    raise OSError("radio busy")
+                sent.append(data)
+
+        client._interface = FlakyInterface()
+        client._tx_queue.extend([b'{"a":1}', b'{"a":2}'])
+        client._tx_wake.set()
+        client._tx_loop()
+        assert sent == []
+        assert client._tx_retry == b'{"a":1}\n{"a":2}'
+
+        client._interface.fail = False
+        client._tx_queue.append(b'{"a":3}')
+        client._tx_wake.set()
+        client._tx_loop()
+        assert sent == [b'{"a":1}\n{"a":2}', b'{"a":3}']
+        assert client._tx_retry is None and not client._tx_queue
+
+    def test_failed_send_dropped(self):
+        """Test rejected packets are dropped so later messages still go out."""
+        from pymeshzork.meshtastic.native_client import NativeClient, NATIVE_MAX_ATTEMPTS
+
+        client = NativeClient("Alice")
+        sent = []
+
+        class RejectingInterface:
+            def sendData(self, data, **kwargs):
+                if data.startswith(b"busy"):
+                    raise OSError("radio busy")
+                if data.startswith(b"bad"):
+                    raise ValueError("Data payload too big")
+                sent.append(data)
+
+        client._interface = RejectingInterface()
+        client._tx_queue.append(b"bad")
+        client._tx_wake.set()
+        client._tx_loop()
+        assert client._tx_retry is None
+
+        client._tx_queue.append(b"busy")
+        for _ in range(NATIVE_MAX_ATTEMPTS):
+            client._tx_wake.set()
+            client._tx_loop()
+        assert client._tx_retry is None
+
+        client._tx_queue.append(b"ok")
+        client._tx_wake.set()
+        client._tx_loop()
+        assert sent == [b"ok"]
+
+    def test_oversized_payload_rejected(self):
+        """Test payloads too large for one packet are refused before queueing."""
+        from pymeshzork.meshtastic.native_client import NativeClient, NATIVE_MAX_PAYLOAD
+
+        client = NativeClient("Alice")
+        client._interface = object()
+        client._state = ConnectionState.CONNECTED
+
+        with pytest.raises(RuntimeError):
+            client._send_raw(b"x" * (NATIVE_MAX_PAYLOAD + 1))
+        assert not client._tx_queue
+
+class TestLRUCache:
+    """Tests for the transport deduplication cache."""
+
+    def test_evicts_oldest(self):
+        """Test the least recently added key is evicted first."""
+        cache = LRUCache(maxsize=4)
+        for key in ("a", "b", "c", "d"):
+            cache.add(key)
+        cache.add("a")  # Refresh a
+        cache.add("e")  # Over capacity: evict down to 3 keys
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" not in cache
+        assert "e" in cache
+
+    def test_check_and_add(self):
+        """Test check_and_add reports only the first sighting of a key."""
+        cache = LRUCache()
+
+        assert cache.check_and_add("p1:1") is True
+        assert cache.check_and_add("p1:1") is False
+        assert "p1:1" in cache
+
+    def test_sweep_reaps_expired(self):
+        """Test periodic sweeps drop expired keys before the cache is full."""
+        clock = [100.0]
+        cache = LRUCache(maxsize=1000, ttl=5)
+        cache._now = lambda: clock[0]
+        for i in range(5):
+            cache.add(f"old{i}")
+        clock[0] += 7
+        for i in range(59):  # 64th insert triggers a sweep
+            cache.add(f"new{i}")
+
+        assert len(cache._cache) == 59
+
+    def test_expired_keys_missing(self):
+        """Test keys older than the TTL are treated as unseen."""
+        clock = [100.0]
+        cache = LRUCache(ttl=5)
+        cache._now = lambda: clock[0]
+        cache.add("a")
+        clock[0] += 5
+
+        assert "a" in cache
+        clock[0] += 1
+        assert "a" not in cache
+        assert cache.check_and_add("a") is True
+
+
+class TestHybridTransport:
+    """Tests for the hybrid transport manager."""
+
+    def test_probe_tcp(self):
+        """Test concurrent TCP probes report listening and closed ports."""
+        import socket
+
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        closed = socket.socket()
+        closed.bind(("127.0.0.1", 0))
+        closed_port = closed.getsockname()[1]
+        closed.close()
+
+        try:
+            results = HybridTransport("Tester")._probe_tcp({
+                TransportType.MQTT: listener.getsockname(),
+                TransportType.MESHTASTIC_NATIVE: ("127.0.0.1", closed_port),
+            }, timeout=1)
+        finally:
+            listener.close()
+
+        assert results == {
+            TransportType.MQTT: True,
+            TransportType.MESHTASTIC_NATIVE: False,
+        }
+
+    def test_probe_tcp_ipv6(self):
+        """Test probes connect to IPv6 endpoints."""
+        import socket
+
+        try:
+            listener = socket.socket(socket.AF_INET6)
+            listener.bind(("::1", 0))
+        except OSError:
+            pytest.skip("IPv6 loopback not available")
+        listener.listen()
+
+        try:
+            results = HybridTransport("Tester")._probe_tcp({
+                TransportType.MQTT: ("::1", listener.getsockname()[1]),
+            }, timeout=1)
+        finally:
+            listener.close()
+
+        assert results == {TransportType.MQTT: True}
+
+    def test_send_falls_back_when_primary_drops(self):
+        """Test sends move to the next transport when the primary disconnects."""
+        transport = HybridTransport("Tester")
+        serial, mqtt = LoopbackClient("Tester"), LoopbackClient("Tester")
+        for tt, client in ((TransportType.MESHTASTIC_SERIAL, serial),
+                           (TransportType.MQTT, mqtt)):
+            client.connect()
+            client.on_state_change(transport._on_client_state)
+            transport._add_transport(tt, client)
+        transport._primary_transport = TransportType.MESHTASTIC_SERIAL
+        transport._refresh_send_order()
+
+        transport.send(create_heartbeat("abc123", "whous"))
+        transport.flush()
+        serial.disconnect()
+        transport.send(create_heartbeat("abc123", "whous"))
+        transport.disconnect()
+
+        assert len(serial.sent) == 1
+        assert len(mqtt.sent) == 1
+
+    def test_flush_falls_back_on_failed_send(self):
+        """Test messages the primary cannot send go out on the next transport."""
+        transport = HybridTransport("Tester")
+        serial, mqtt = LoopbackClient("Tester"), LoopbackClient("Tester")
+        for tt, client in ((TransportType.MESHTASTIC_SERIAL, serial),
+                           (TransportType.MQTT, mqtt)):
+            client.connect()
+            transport._add_transport(tt, client)
+        transport._primary_transport = TransportType.MESHTASTIC_SERIAL
+        transport._refresh_send_order()
+
+        serial.fail = True
+        for text in ("one", "two"):
+            transport._outbox.append(create_chat_message("abc123", text, "whous"))
+        assert transport.flush() == 2
+
+        assert serial.sent == []
+        assert not serial._outgoing_queue
+        assert [decode_message(data).data["m"] for data in mqtt.sent] == ["one", "two"]
+
+    def test_status_tracks_updates(self):
+        """Test only checked transports are reported in status."""
+        transport = HybridTransport("Tester")
+        transport._update_status(TransportType.MQTT, available=True, error="slow")
+
+        status = transport.get_status()["transports"]
+        assert status == {"MQTT": {"available": True, "connected": False, "error": "slow"}}
+        assert transport.get_transport_status(TransportType.MQTT).available
+
+    def test_send_batches_messages(self):
+        """Test messages sent close together reach the client as one batch."""
+        transport = HybridTransport("Tester")
+        client = LoopbackClient("Tester")
+        batches = []
+        client.send_batch = lambda messages: batches.append(list(messages)) or len(messages)
+        client.connect()
+        transport._add_transport(TransportType.MQTT, client)
+        transport._primary_transport = TransportType.MQTT
+        transport._refresh_send_order()
+
+        for _ in range(3):
+            assert transport.send(create_heartbeat("abc123", "whous"))
+        transport.disconnect()
+
+        assert [len(batch) for batch in batches] == [3]
+
+    def test_flush_thread_wakes_for_new_burst(self):
+        """Test the idle flush thread sends a burst once its window ends."""
+        transport = HybridTransport("Tester")
+        client = LoopbackClient("Tester")
+        client.connect()
+        transport._add_transport(TransportType.MQTT, client)
+        transport._primary_transport = TransportType.MQTT
+        transport._refresh_send_order()
+
+        try:
+            for _ in range(2):
+                transport.send(create_heartbeat("abc123", "whous"))
+                deadline = time.monotonic() + 2
+                while transport._outbox and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert not transport._outbox
+        finally:
+            transport.disconnect()
+
+        assert len(client.sent) == 2
+
+
+class TestMultiplayerManager:
+    """Tests for the game-facing multiplayer manager."""
+
+    def test_announcements_sent_as_batch(self):
+        """Test announcements are held in the outbox and flushed together."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        client = LoopbackClient("Tester")
+        batches = []
+        client.send_batch = lambda messages: batches.append(list(messages)) or len(messages)
+        client.on_state_change(manager._on_client_state)
+        client.connect()
+        manager._client = client
+
+        manager.send_join("whous")
+        manager.send_action("take", "lamp")
+        manager.send_move("whous", "lroom")
+        manager.flush()
+
+        assert [[m.type for m in batch] for batch in batches] == [
+            [MessageType.PLAYER_JOIN, MessageType.PLAYER_ACTION, MessageType.PLAYER_MOVE]
+        ]
+        assert batches[0][1].data["r"] == ROOM_IDS["whous"]
+
+
+    def test_rapid_moves_coalesced(self):
+        """Test back-to-back moves go out as one move from the first room."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        client = LoopbackClient("Tester")
+        batches = []
+        client.send_batch = lambda messages: batches.append(list(messages)) or len(messages)
+        client.on_state_change(manager._on_client_state)
+        client.connect()
+        manager._client = client
+
+        manager.send_move("whous", "lroom")
+        manager.send_move("lroom", "cella")
+        manager.flush()
+
+        [[move]] = batches
+        assert move.data["f"] == ROOM_IDS["whous"]
+        assert move.data["r"] == ROOM_IDS["cella"]
+        assert client.current_room == "cella"
+
+    def test_room_players_pushed_only_on_change(self):
+        """Test OLED player-list refreshes are coalesced and skip no-op updates."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        pushed = []
+
+        class FakeDisplay:
+            def add_message(self, text):
+                pass
+
+            def update_player(self, name, room_id=None, room_name=None):
+                pass
+
+            def set_players_in_room(self, names):
+                pushed.append(names)
+
+        manager._bind_display(FakeDisplay())
+        manager.set_game(SimpleNamespace(state=SimpleNamespace(current_room="whous")))
+        alice = PlayerInfo(player_id="aaa111", name="Alice", room_id="whous")
+        bob = PlayerInfo(player_id="bbb222", name="Bob", room_id="lroom")
+
+        # A burst of events produces a single refresh
+        manager._handle_player_join(alice)
+        manager._handle_player_join(bob)
+        manager.update_room("whous")
+        manager._handle_player_move(bob, "lroom", "whous")
+        manager._flush_display()
+        manager._handle_player_leave(alice)
+        manager._flush_display()
+        manager.update_room("whous")
+        manager._flush_display()
+
+        assert pushed == [["Alice", "Bob"], ["Bob"]]
+
+
+    def test_room_players_follow_heartbeats(self):
+        """Test the OLED player list follows rooms learned from heartbeats."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        pushed = []
+
+        class FakeDisplay:
+            def add_message(self, text):
+                pass
+
+            def update_player(self, name, room_id=None, room_name=None):
+                pass
+
+            def set_players_in_room(self, names):
+                pushed.append(names)
+
+        manager._bind_display(FakeDisplay())
+        manager.set_game(SimpleNamespace(state=SimpleNamespace(current_room="kitch")))
+        presence = PresenceManager("me0000")
+        manager._wire_presence(presence)
+
+        presence.handle_message(create_join_message("aaa111", "Alice", "whous", seq=1))
+        manager._flush_display()
+        presence.handle_message(create_heartbeat("aaa111", "kitch", seq=2))
+        manager._flush_display()
+
+        assert pushed == [[], ["Alice"]]
+
+    def test_players_here_follows_presence(self):
+        """Test rooms changed by heartbeats and chat show in the players-here text."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        presence = PresenceManager("me0000")
+        manager._wire_presence(presence)
+
+        presence.handle_message(create_join_message("aaa111", "Alice", "whous", seq=1))
+        assert manager.format_players_in_room("whous") == "Alice is here."
+
+        presence.handle_message(create_heartbeat("aaa111", "kitch", seq=2))
+        presence.handle_message(
+            create_chat_message("bbb222", "hi", "kitch", player_name="Bob", seq=1)
+        )
+
+        assert [p.name for p in presence.get_players_in_room("kitch")] == ["Alice", "Bob"]
+        assert manager.format_players_in_room("kitch") == "Alice and Bob are here."
+        assert manager.format_players_in_room("whous") is None
+
+    def test_events_drained_with_callbacks(self):
+        """Test remote events yield display lines and run callbacks on drain."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        manager.set_game(SimpleNamespace(state=SimpleNamespace(current_room="whous")))
+        chats = []
+        manager.on_chat(lambda player, message, is_team: chats.append(message))
+        alice = PlayerInfo(player_id="aaa111", name="Alice", room_id="whous")
+
+        manager._handle_player_join(alice)
+        manager._handle_chat(alice, "hello", False)
+        manager._handle_player_action(
+            PlayerInfo(player_id="bbb222", name="Bob", room_id="lroom"), "take", "lamp"
+        )
+        assert chats == []
+
+        assert manager.get_pending_messages() == [
+            "\n[Alice has entered the game]",
+            '\nAlice says: "hello"',
+        ]
+        assert chats == ["hello"]
+        assert manager.get_pending_messages() == []
+
+    def test_pending_lines_deduplicated(self):
+        """Test a player's repeated moves within one drain show only the latest."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        manager.set_game(SimpleNamespace(state=SimpleNamespace(current_room="whous")))
+        bob = PlayerInfo(player_id="bbb222", name="Bob", room_id="lroom")
+
+        manager._handle_player_move(bob, "lroom", "whous")
+        manager._handle_chat(bob, "hi", False)
+        manager._handle_player_move(bob, "whous", "lroom")
+        manager._handle_chat(bob, "hi", False)
+        manager._handle_player_move(bob, "lroom", "whous")
+
+        assert manager.get_pending_messages() == [
+            '\nBob says: "hi"',
+            "\nBob has arrived.",
+        ]
+
+    def test_format_players_in_room(self):
+        """Test the players-here text follows joins, moves and leaves."""
+        manager = MultiplayerManager("Tester", backend="mqtt")
+        players = [
+            PlayerInfo(player_id=f"p{i}", name=name, room_id="whous")
+            for i, name in enumerate(["Alice", "Bob", "Carol"])
+        ]
+
+        assert manager.format_players_in_room("whous") is None
+        manager._handle_player_join(players[0])
+        assert manager.format_players_in_room("whous") == "Alice is here."
+        manager._handle_player_join(players[1])
+        assert manager.format_players_in_room("whous") == "Alice and Bob are here."
+        manager._handle_player_join(players[2])
+        assert manager.format_players_in_room("whous") == "Alice, Bob, and Carol are here."
+        manager._handle_player_move(players[1], "whous", "lroom")
+        manager._handle_player_leave(players[0])
+        assert manager.format_players_in_room("whous") == "Carol is here."
+        assert manager.format_players_in_room("lroom") == "Bob is here."
+
+
 class TestMessageSize:
     """Tests to verify message sizes stay within LoRa limits."""
 